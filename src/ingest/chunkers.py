@@ -75,14 +75,23 @@ class ChunkingStrategy(ABC):
         """
         ...
     
-    def chunk_text(self, text: str, source: str = "unknown") -> List[Chunk]:
+    def chunk_text(
+        self,
+        text: str,
+        source: str = "unknown",
+        page_number: Optional[int] = None,
+    ) -> List[Chunk]:
         """Split raw text into chunks.
         
         Convenience method for chunking text without a Document wrapper.
+        The built-in strategies implement their splitting here and have
+        chunk() delegate to it; this default wraps the text for
+        strategies that only implement chunk().
         
         Args:
             text: The text to split
             source: Source identifier for metadata
+            page_number: Page number recorded on each chunk
             
         Returns:
             List of Chunk objects
@@ -90,7 +99,7 @@ class ChunkingStrategy(ABC):
         from .models import DocumentMetadata
         doc = Document(
             content=text,
-            metadata=DocumentMetadata(source=source)
+            metadata=DocumentMetadata(source=source, page_number=page_number)
         )
         return self.chunk(doc)
     
@@ -182,10 +191,25 @@ class FixedSizeChunker(ChunkingStrategy):
         Returns:
             List of Chunk objects
         """
-        text = document.content
-        source = document.metadata.source
-        page_number = document.metadata.page_number
+        metadata = document.metadata
+        return self.chunk_text(document.content, metadata.source, metadata.page_number)
+    
+    def chunk_text(
+        self,
+        text: str,
+        source: str = "unknown",
+        page_number: Optional[int] = None,
+    ) -> List[Chunk]:
+        """Split raw text into fixed-size chunks.
         
+        Args:
+            text: The text to split
+            source: Source identifier for metadata
+            page_number: Page number recorded on each chunk
+            
+        Returns:
+            List of Chunk objects
+        """
         if not text:
             return []
         
@@ -289,10 +313,25 @@ class RecursiveChunker(ChunkingStrategy):
         Returns:
             List of Chunk objects
         """
-        text = document.content
-        source = document.metadata.source
-        page_number = document.metadata.page_number
+        metadata = document.metadata
+        return self.chunk_text(document.content, metadata.source, metadata.page_number)
+    
+    def chunk_text(
+        self,
+        text: str,
+        source: str = "unknown",
+        page_number: Optional[int] = None,
+    ) -> List[Chunk]:
+        """Split raw text recursively using separators.
         
+        Args:
+            text: The text to split
+            source: Source identifier for metadata
+            page_number: Page number recorded on each chunk
+            
+        Returns:
+            List of Chunk objects
+        """
         if not text:
             return []
         
@@ -456,6 +495,28 @@ class SemanticChunker(ChunkingStrategy):
         Returns:
             List of Chunk objects
             
+        Raises:
+            ValueError: If no embedding function is provided
+        """
+        metadata = document.metadata
+        return self.chunk_text(document.content, metadata.source, metadata.page_number)
+    
+    def chunk_text(
+        self,
+        text: str,
+        source: str = "unknown",
+        page_number: Optional[int] = None,
+    ) -> List[Chunk]:
+        """Split raw text based on semantic similarity.
+        
+        Args:
+            text: The text to split
+            source: Source identifier for metadata
+            page_number: Page number recorded on each chunk
+            
+        Returns:
+            List of Chunk objects
+            
         Raises:
             ValueError: If no embedding function is provided
         """
@@ -465,10 +526,6 @@ class SemanticChunker(ChunkingStrategy):
                 "Provide a function that takes text and returns an embedding vector."
             )
         
-        text = document.content
-        source = document.metadata.source
-        page_number = document.metadata.page_number
-        
         if not text:
             return []
         
@@ -606,17 +663,17 @@ class SemanticChunker(ChunkingStrategy):
         Returns:
             List of sentences that fit within overlap
         """
-        result: List[str] = []
+        # Walk backwards by index and slice once instead of prepending
+        i = len(sentences) - 1
         total_length = 0
         
-        for sentence in reversed(sentences):
-            if total_length + len(sentence) + 1 <= target_overlap:
-                result.insert(0, sentence)
-                total_length += len(sentence) + 1
-            else:
+        while i >= 0:
+            total_length += len(sentences[i]) + 1
+            if total_length > target_overlap:
                 break
+            i -= 1
         
-        return result
+        return sentences[i + 1:]
 
 
 class SentenceChunker(ChunkingStrategy):
@@ -672,10 +729,25 @@ class SentenceChunker(ChunkingStrategy):
         Returns:
             List of Chunk objects
         """
-        text = document.content
-        source = document.metadata.source
-        page_number = document.metadata.page_number
+        metadata = document.metadata
+        return self.chunk_text(document.content, metadata.source, metadata.page_number)
+    
+    def chunk_text(
+        self,
+        text: str,
+        source: str = "unknown",
+        page_number: Optional[int] = None,
+    ) -> List[Chunk]:
+        """Split raw text by sentences.
         
+        Args:
+            text: The text to split
+            source: Source identifier for metadata
+            page_number: Page number recorded on each chunk
+            
+        Returns:
+            List of Chunk objects
+        """
         if not text:
             return []
         
@@ -873,14 +945,14 @@ class SentenceChunker(ChunkingStrategy):
         Returns:
             List of sentences that fit within overlap
         """
-        result: List[str] = []
+        # Walk backwards by index and slice once instead of prepending
+        i = len(sentences) - 1
         total_length = 0
         
-        for sentence in reversed(sentences):
-            if total_length + len(sentence) + 1 <= target_overlap:
-                result.insert(0, sentence)
-                total_length += len(sentence) + 1
-            else:
+        while i >= 0:
+            total_length += len(sentences[i]) + 1
+            if total_length > target_overlap:
                 break
+            i -= 1
         
-        return result
+        return sentences[i + 1:]
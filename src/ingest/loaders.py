@@ -5,11 +5,58 @@ for PDF, DOCX, HTML, and Markdown files.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
+import mmap
+import os
 import re
+import sys
 
-from .models import Document, DocumentMetadata
+from .models import Document, DocumentMetadata, _intern_optional
+
+
+# Fallback formats for frontmatter dates that are not ISO-8601
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%B %d, %Y",
+)
+
+# Vertical distance (in points) below which characters share a text line
+_PDF_LINE_TOLERANCE = 3.0
+
+# Text files at least this large are memory-mapped instead of read()
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_text_file(path: Path) -> str:
+    """Read a UTF-8 text file, decoding undecodable bytes leniently.
+    
+    Large files are memory-mapped and decoded straight from the mapping,
+    avoiding the intermediate buffers of a text-mode read(). Line endings
+    are normalized to ``\\n`` as in universal-newlines mode.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        The decoded file content
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            content = f.read().decode("utf-8", errors="ignore")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, "utf-8", "ignore")
+    
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 class DocumentLoader(ABC):
@@ -88,6 +135,8 @@ class PDFLoader(DocumentLoader):
         extract_per_page: If True, returns one Document per page.
                          If False, returns a single Document with all content.
         use_pdfplumber: If True, attempts to use pdfplumber for better extraction.
+        fast_text_only: If True, the pdfplumber path builds text straight from
+                        the page characters and skips layout analysis.
     """
     
     supported_extensions = [".pdf"]
@@ -95,16 +144,21 @@ class PDFLoader(DocumentLoader):
     def __init__(
         self,
         extract_per_page: bool = True,
-        use_pdfplumber: bool = True
+        use_pdfplumber: bool = True,
+        fast_text_only: bool = False
     ) -> None:
         """Initialize the PDF loader.
         
         Args:
             extract_per_page: Whether to create separate documents per page
             use_pdfplumber: Whether to use pdfplumber for enhanced extraction
+            fast_text_only: Whether to skip layout analysis and read text
+                directly from page characters (much faster on
+                graphics-heavy pages, at the cost of word spacing fidelity)
         """
         self.extract_per_page = extract_per_page
         self.use_pdfplumber = use_pdfplumber
+        self.fast_text_only = fast_text_only
     
     def load(self, path: Path) -> List[Document]:
         """Load a PDF document.
@@ -147,14 +201,17 @@ class PDFLoader(DocumentLoader):
         
         # Extract metadata from PDF
         pdf_metadata = reader.metadata or {}
-        title = pdf_metadata.get("/Title")
-        author = pdf_metadata.get("/Author")
+        title = _intern_optional(pdf_metadata.get("/Title"))
+        author = _intern_optional(pdf_metadata.get("/Author"))
+        source = sys.intern(str(path))
+        
+        # Extract every page once; both output modes build on this list
+        page_texts = [page.extract_text() or "" for page in reader.pages]
         
         if self.extract_per_page:
-            for page_num, page in enumerate(reader.pages, start=1):
-                text = page.extract_text() or ""
+            for page_num, text in enumerate(page_texts, start=1):
                 metadata = DocumentMetadata(
-                    source=str(path),
+                    source=source,
                     page_number=page_num,
                     total_pages=total_pages,
                     title=title,
@@ -163,11 +220,9 @@ class PDFLoader(DocumentLoader):
                 )
                 documents.append(Document(content=text, metadata=metadata))
         else:
-            all_text = "\n\n".join(
-                page.extract_text() or "" for page in reader.pages
-            )
+            all_text = "\n\n".join(page_texts)
             metadata = DocumentMetadata(
-                source=str(path),
+                source=source,
                 total_pages=total_pages,
                 title=title,
                 author=author,
@@ -188,20 +243,30 @@ class PDFLoader(DocumentLoader):
             )
         
         documents: List[Document] = []
+        extract_text = (
+            self._extract_chars_text if self.fast_text_only
+            else self._extract_layout_text
+        )
         
         with pdfplumber.open(str(path)) as pdf:
-            total_pages = len(pdf.pages)
+            pages = pdf.pages
+            total_pages = len(pages)
             
             # Extract metadata
             pdf_metadata = pdf.metadata or {}
-            title = pdf_metadata.get("Title")
-            author = pdf_metadata.get("Author")
+            title = _intern_optional(pdf_metadata.get("Title"))
+            author = _intern_optional(pdf_metadata.get("Author"))
+            source = sys.intern(str(path))
+            
+            # Extract every page once; both output modes build on this list
+            page_texts = [extract_text(page) for page in pages]
             
             if self.extract_per_page:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    text = page.extract_text() or ""
+                for page_num, (page, text) in enumerate(
+                    zip(pages, page_texts), start=1
+                ):
                     metadata = DocumentMetadata(
-                        source=str(path),
+                        source=source,
                         page_number=page_num,
                         total_pages=total_pages,
                         title=title,
@@ -211,11 +276,9 @@ class PDFLoader(DocumentLoader):
                     )
                     documents.append(Document(content=text, metadata=metadata))
             else:
-                all_text = "\n\n".join(
-                    page.extract_text() or "" for page in pdf.pages
-                )
+                all_text = "\n\n".join(page_texts)
                 metadata = DocumentMetadata(
-                    source=str(path),
+                    source=source,
                     total_pages=total_pages,
                     title=title,
                     author=author,
@@ -224,6 +287,39 @@ class PDFLoader(DocumentLoader):
                 documents.append(Document(content=all_text, metadata=metadata))
         
         return documents
+    
+    @staticmethod
+    def _extract_layout_text(page: Any) -> str:
+        """Extract page text using pdfplumber's layout analysis."""
+        return page.extract_text() or ""
+    
+    @staticmethod
+    def _extract_chars_text(page: Any) -> str:
+        """Extract page text from its characters, skipping layout analysis.
+        
+        Characters are clustered into lines by their vertical position
+        and each line is read left-to-right.
+        
+        Args:
+            page: A pdfplumber Page object
+            
+        Returns:
+            The page text
+        """
+        lines: List[List[Dict[str, Any]]] = []
+        line_top: Optional[float] = None
+        
+        for char in sorted(page.chars, key=itemgetter("top")):
+            if line_top is None or char["top"] - line_top > _PDF_LINE_TOLERANCE:
+                lines.append([])
+                line_top = char["top"]
+            lines[-1].append(char)
+        
+        by_x0 = itemgetter("x0")
+        return "\n".join(
+            "".join(char["text"] for char in sorted(line, key=by_x0))
+            for line in lines
+        )
 
 
 
@@ -291,30 +387,23 @@ class DOCXLoader(DocumentLoader):
         created = core_props.created
         modified = core_props.modified
         
+        # python-docx rebuilds the paragraph list on every attribute access
+        paragraphs = doc.paragraphs
+        tables = doc.tables
+        preserve_structure = self.preserve_structure
+        
         # Extract text content
-        content_parts: List[str] = []
-        
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text:
-                # Add structure markers for headings
-                if self.preserve_structure and para.style.name.startswith("Heading"):
-                    level = para.style.name.replace("Heading ", "")
-                    try:
-                        level_num = int(level)
-                        prefix = "#" * level_num + " "
-                    except ValueError:
-                        prefix = "# "
-                    content_parts.append(f"{prefix}{text}")
-                else:
-                    content_parts.append(text)
+        stripped = ((para, para.text.strip()) for para in paragraphs)
+        content_parts: Iterator[str] = (
+            self._render_paragraph(para, text) if preserve_structure else text
+            for para, text in stripped
+            if text
+        )
         
         # Extract table content
         if self.include_tables:
-            for table in doc.tables:
-                table_text = self._extract_table_text(table)
-                if table_text:
-                    content_parts.append(table_text)
+            table_texts = (self._extract_table_text(table) for table in tables)
+            content_parts = chain(content_parts, filter(None, table_texts))
         
         content = "\n\n".join(content_parts)
         
@@ -326,13 +415,33 @@ class DOCXLoader(DocumentLoader):
             modified_date=modified,
             file_type="docx",
             extra={
-                "paragraph_count": len(doc.paragraphs),
-                "table_count": len(doc.tables),
+                "paragraph_count": len(paragraphs),
+                "table_count": len(tables),
             },
         )
         
         return [Document(content=content, metadata=metadata)]
     
+    def _render_paragraph(self, para: Any, text: str) -> str:
+        """Render a paragraph, adding a Markdown marker for headings.
+        
+        Args:
+            para: A python-docx Paragraph object
+            text: The paragraph's stripped text
+            
+        Returns:
+            The text prefixed with ``#`` markers if the paragraph is a heading
+        """
+        style_name = para.style.name
+        if not style_name.startswith("Heading"):
+            return text
+        level = style_name.replace("Heading ", "")
+        try:
+            prefix = "#" * int(level) + " "
+        except ValueError:
+            prefix = "# "
+        return f"{prefix}{text}"
+    
     def _extract_table_text(self, table: Any) -> str:
         """Extract text from a table as formatted text.
         
@@ -342,11 +451,11 @@ class DOCXLoader(DocumentLoader):
         Returns:
             Formatted string representation of the table
         """
-        rows: List[str] = []
-        for row in table.rows:
-            cells = [cell.text.strip() for cell in row.cells]
-            rows.append(" | ".join(cells))
-        return "\n".join(rows)
+        strip = str.strip
+        return "\n".join(
+            " | ".join(map(strip, (cell.text for cell in row.cells)))
+            for row in table.rows
+        )
 
 
 
@@ -406,8 +515,7 @@ class HTMLLoader(DocumentLoader):
             )
         
         # Read the HTML file
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            html_content = f.read()
+        html_content = _read_text_file(path)
         
         soup = BeautifulSoup(html_content, "html.parser")
         
@@ -459,14 +567,36 @@ class HTMLLoader(DocumentLoader):
         Returns:
             Text content with links in markdown format
         """
-        # Convert links to markdown format
-        for a_tag in soup.find_all("a", href=True):
-            link_text = a_tag.get_text(strip=True)
-            href = a_tag["href"]
-            if link_text and href:
-                a_tag.replace_with(f"[{link_text}]({href})")
-        
-        return soup.get_text(separator="\n", strip=True)
+        from bs4 import Tag
+        
+        # Same string types soup.get_text() would emit (skips comments etc.)
+        text_types = soup.interesting_string_types
+        if isinstance(text_types, type):
+            text_types = (text_types,)
+        
+        # Single depth-first walk: links are emitted in markdown format and
+        # their subtree skipped, so the tree is neither mutated nor rescanned
+        parts: List[str] = []
+        stack = [iter(soup.contents)]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                continue
+            if isinstance(node, Tag):
+                if node.name == "a" and node.has_attr("href"):
+                    link_text = node.get_text(strip=True)
+                    href = node["href"]
+                    if link_text and href:
+                        parts.append(f"[{link_text}]({href})")
+                        continue
+                stack.append(iter(node.contents))
+            elif type(node) in text_types:
+                text = node.strip()
+                if text:
+                    parts.append(text)
+        
+        return "\n".join(parts)
 
 
 
@@ -513,8 +643,7 @@ class MarkdownLoader(DocumentLoader):
         self._validate_path(path)
         
         # Read the file content
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
+        content = _read_text_file(path)
         
         # Extract frontmatter if present
         frontmatter: Dict[str, Any] = {}
@@ -586,7 +715,8 @@ class MarkdownLoader(DocumentLoader):
     def _parse_yaml(self, yaml_text: str) -> Dict[str, Any]:
         """Parse YAML frontmatter text.
         
-        Uses PyYAML if available, otherwise falls back to simple parsing.
+        Uses PyYAML (with its libyaml C loader when available) if installed,
+        otherwise falls back to simple parsing.
         
         Args:
             yaml_text: YAML formatted text
@@ -596,7 +726,9 @@ class MarkdownLoader(DocumentLoader):
         """
         try:
             import yaml
-            return yaml.safe_load(yaml_text) or {}
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            return yaml.load(yaml_text, Loader=loader) or {}
         except ImportError:
             # Simple fallback parser for basic key: value pairs
             result: Dict[str, Any] = {}
@@ -638,20 +770,17 @@ class MarkdownLoader(DocumentLoader):
         Returns:
             Parsed datetime or None
         """
-        from datetime import datetime
-        
         if isinstance(date_value, datetime):
             return date_value
         
         if isinstance(date_value, str):
+            # Fast path: frontmatter dates are almost always ISO-8601
+            try:
+                return datetime.fromisoformat(date_value)
+            except ValueError:
+                pass
             # Try common date formats
-            formats = [
-                "%Y-%m-%d",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%d %H:%M:%S",
-                "%B %d, %Y",
-            ]
-            for fmt in formats:
+            for fmt in _DATE_FORMATS:
                 try:
                     return datetime.strptime(date_value, fmt)
                 except ValueError:
@@ -14,16 +14,161 @@ Extractors:
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+from itertools import repeat
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+import copy
+import logging
 import os
+import pickle
 import re
+import weakref
 
 from .models import Document, DocumentMetadata, Chunk, ChunkMetadata
 
 
+logger = logging.getLogger(__name__)
+
+# Errors an extractor may raise on malformed content or metadata; the
+# pipeline skips that extractor for the item. Anything else (MemoryError,
+# bugs such as NameError) propagates.
+_EXTRACTOR_ERRORS = (re.error, ValueError, KeyError, AttributeError, TypeError, OSError)
+
+
+# Helpers for cleaning extracted text
+_STRIP_TAGS_RE = re.compile(r'<[^>]+>')
+_FNAME_CLEAN_RE = re.compile(r'[_\-\s]+')
+
+def _strip_tags(text: str) -> str:
+    """Remove HTML tags from heading text.
+    
+    Most headings contain no nested markup, so the regex is only run
+    when the text contains a '<'.
+    """
+    if '<' in text:
+        return _STRIP_TAGS_RE.sub('', text)
+    return text
+
+
+# HTML heading body: any text up to the closing tag that does not open
+# another heading. Stopping at the next '<hN' bounds every failed attempt
+# (e.g. a run of unclosed tags in malformed HTML) to the gap between
+# opening tags, keeping the scan linear instead of quadratic
+_HTML_HEADING_BODY = r'(?:[^<]|<(?!h[1-6]))+?'
+
+
+def _hashable(value: Any) -> Hashable:
+    """Return value if it can be hashed, else its repr()."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _compile_heading_pattern(
+    min_level: int,
+    max_level: int,
+    as_bytes: bool = False,
+) -> Optional[Pattern[Any]]:
+    """Compile one alternation regex for headings within a level range.
+    
+    ATX, HTML and Setext H1/H2 headings are combined so a single scan
+    yields headings in document order, and levels outside the range are
+    excluded by the pattern itself rather than filtered afterwards.
+    Whitespace after the ATX hashes and at the end of a line is matched
+    with [^\\S\\n], so a match never runs into the next line and hides a
+    heading there.
+    
+    Args:
+        min_level: Minimum heading level to match
+        max_level: Maximum heading level to match
+        as_bytes: Compile a bytes pattern for UTF-8 encoded content
+        
+    Returns:
+        Compiled pattern, or None if no level 1-6 is in range
+    """
+    low, high = max(min_level, 1), min(max_level, 6)
+    if low > high:
+        return None
+    
+    alternatives = [
+        rf'^(?P<atx>#{{{low},{high}}})[^\S\n]+(?P<atx_text>.+?)(?:[^\S\n]*#*)?$',
+        rf'(?i:<h(?P<html>[{low}-{high}])[^<>]*>(?P<html_text>{_HTML_HEADING_BODY})</h(?P=html)>)',
+    ]
+    setext_rules = [
+        rule for level, rule in ((1, '={3,}'), (2, '-{3,}')) if low <= level <= high
+    ]
+    if setext_rules:
+        # An ATX or HTML heading line is never Setext text, even when its
+        # level is excluded from this pattern
+        alternatives.append(
+            rf'^(?!#{{1,6}}\s|(?i:<h[1-6][^<>]*>{_HTML_HEADING_BODY}</h[1-6]>))'
+            rf'(?P<setext_text>.+)\n(?P<setext>{"|".join(setext_rules)})[^\S\n]*$'
+        )
+    source = '|'.join(alternatives)
+    return re.compile(source.encode('ascii') if as_bytes else source, re.MULTILINE)
+
+
+# All supported heading syntaxes at every level
+_ALL_HEADINGS_RE = _compile_heading_pattern(1, 6)
+
+# Heading syntaxes reported by _scan_headings
+_ATX, _SETEXT, _HTML = "atx", "setext", "html"
+
+# Shortest text any heading syntax can match ("# x"); shorter content,
+# such as empty PDF pages, is not handed to the regex engine at all
+_MIN_HEADING_LENGTH = 3
+
+
+def _group_text(match: re.Match, name: str) -> str:
+    """Return a match group as text, decoding bytes matches as UTF-8."""
+    value = match.group(name)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return value
+
+
+def _scan_headings(
+    content: Union[str, bytes],
+    pattern: Optional[Pattern[Any]] = _ALL_HEADINGS_RE,
+) -> Iterator[Tuple[int, str, int, str]]:
+    """Scan content once for headings of every supported syntax.
+    
+    Bytes content must be scanned with a bytes pattern; only the captured
+    heading text is decoded, and positions are byte offsets.
+    
+    Args:
+        content: Text content, or UTF-8 encoded bytes, to analyze
+        pattern: Heading pattern from _compile_heading_pattern
+        
+    Yields:
+        (level, title, position, syntax) tuples in document order, where
+        syntax is _ATX, _SETEXT or _HTML
+    """
+    if pattern is None or len(content) < _MIN_HEADING_LENGTH:
+        return
+    
+    for match in pattern.finditer(content):
+        hashes = match.group('atx')
+        if hashes is not None:
+            yield len(hashes), _group_text(match, 'atx_text').strip(), match.start(), _ATX
+            continue
+        
+        html_level = match.group('html')
+        if html_level is not None:
+            title = _strip_tags(_group_text(match, 'html_text')).strip()
+            yield int(html_level), title, match.start(), _HTML
+            continue
+        
+        level = 1 if _group_text(match, 'setext')[0] == '=' else 2
+        yield level, _group_text(match, 'setext_text').strip(), match.start(), _SETEXT
+
+
 class MetadataExtractor(ABC):
     """Abstract base class for metadata extractors.
     
@@ -32,8 +177,14 @@ class MetadataExtractor(ABC):
     
     Subclasses must implement the extract() method to handle
     their specific extraction logic.
+    
+    Attributes:
+        uses_headings: Whether the pipeline should pass its shared
+            all-level heading scan to extract() as precomputed_headings
     """
     
+    uses_headings: bool = False
+    
     @abstractmethod
     def extract(self, content: str, existing_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Extract metadata from content.
@@ -47,6 +198,64 @@ class MetadataExtractor(ABC):
         """
         ...
     
+    def compile(self) -> None:
+        """Prepare any regex patterns extract() needs ahead of time.
+        
+        Called by MetadataEnrichmentPipeline when extractors are set, so
+        compilation happens once, before the first item (and before worker
+        processes are started), not during enrichment. The default does
+        nothing; extractors using module-level patterns need no set-up.
+        """
+    
+    def cache_key(self, existing_metadata: Optional[Dict[str, Any]] = None) -> Optional[Hashable]:
+        """Return the metadata fields extract() depends on, for memoization.
+        
+        The pipeline reuses an earlier result when the content and this key
+        are both unchanged. Extractors whose output depends on anything
+        else (e.g. the filesystem) must return None, the default, which
+        disables caching for them.
+        
+        Args:
+            existing_metadata: Metadata that would be passed to extract()
+            
+        Returns:
+            Hashable key, or None if results must not be cached
+        """
+        return None
+    
+    def config_key(self) -> Hashable:
+        """Return this extractor's settings, for keying memoized results.
+        
+        A cached result is only reused while this key is unchanged, so a
+        result computed before e.g. min_level changed is never returned.
+        The default covers the class and every public attribute;
+        extractors configured through anything else should override it.
+        
+        Returns:
+            Hashable snapshot of the extractor's configuration
+        """
+        settings = sorted(
+            (name, _hashable(value))
+            for name, value in vars(self).items()
+            if not name.startswith("_")
+        )
+        return type(self), tuple(settings)
+    
+    def shared_key(self, existing_metadata: Optional[Dict[str, Any]] = None) -> Optional[Hashable]:
+        """Return a key under which extract() ignores the content.
+        
+        Within one batch, items with equal keys get the same result, so
+        the pipeline runs the extractor once per key instead of once per
+        item. Extractors that read the content return None, the default.
+        
+        Args:
+            existing_metadata: Metadata that would be passed to extract()
+            
+        Returns:
+            Hashable key, or None if the result depends on the content
+        """
+        return None
+    
     def extract_from_document(self, document: Document) -> Dict[str, Any]:
         """Extract metadata from a Document object.
         
@@ -72,7 +281,18 @@ class MetadataExtractor(ABC):
         return self.extract(chunk.content, existing)
 
 
-@dataclass
+def _epoch_to_iso(timestamp: Optional[float]) -> Optional[str]:
+    """Format an epoch timestamp as a local ISO 8601 string.
+    
+    SourceInfo keeps raw stat() times and only builds a datetime here,
+    when the info is serialized.
+    """
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+@dataclass(slots=True)
 class SourceInfo:
     """Information about a document source.
     
@@ -82,31 +302,28 @@ class SourceInfo:
         extension: File extension (e.g., '.pdf')
         directory: Parent directory path
         file_size: Size of the file in bytes
-        created_time: File creation timestamp
-        modified_time: File modification timestamp
+        created_time: File creation timestamp (epoch seconds)
+        modified_time: File modification timestamp (epoch seconds)
     """
     path: str
     filename: str
     extension: str
     directory: str
     file_size: Optional[int] = None
-    created_time: Optional[datetime] = None
-    modified_time: Optional[datetime] = None
+    created_time: Optional[float] = None
+    modified_time: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        result = {
+        return {
             "path": self.path,
             "filename": self.filename,
             "extension": self.extension,
             "directory": self.directory,
             "file_size": self.file_size,
+            "created_time": _epoch_to_iso(self.created_time),
+            "modified_time": _epoch_to_iso(self.modified_time),
         }
-        if self.created_time:
-            result["created_time"] = self.created_time.isoformat()
-        if self.modified_time:
-            result["modified_time"] = self.modified_time.isoformat()
-        return result
 
 
 class SourceExtractor(MetadataExtractor):
@@ -120,6 +337,12 @@ class SourceExtractor(MetadataExtractor):
         include_size: Whether to include file size
     """
     
+    # Upper bound on cached stat results before the cache is reset
+    STAT_CACHE_SIZE = 4096
+    
+    # Threads used by prefetch() to overlap stat() calls
+    STAT_WORKERS = 32
+    
     def __init__(
         self,
         include_timestamps: bool = True,
@@ -133,6 +356,11 @@ class SourceExtractor(MetadataExtractor):
         """
         self.include_timestamps = include_timestamps
         self.include_size = include_size
+        # path -> (exists, size, ctime, mtime, absolute path); chunks of the
+        # same source share one entry so the file is only stat()ed once
+        self._stat_cache: Dict[
+            str, Tuple[bool, Optional[int], Optional[float], Optional[float], str]
+        ] = {}
     
     def extract(self, content: str, existing_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Extract source metadata.
@@ -152,45 +380,131 @@ class SourceExtractor(MetadataExtractor):
         
         return {"source_info": source_info.to_dict()}
     
+    def shared_key(self, existing_metadata: Optional[Dict[str, Any]] = None) -> Optional[Hashable]:
+        """Source results depend on the source path alone."""
+        if not existing_metadata:
+            return ()
+        return (existing_metadata.get("source"),)
+    
     def extract_from_path(self, path: str) -> SourceInfo:
         """Extract source information from a file path.
         
+        File stats are cached per path for the lifetime of the extractor;
+        call clear_cache() if files may change between extractions.
+        
         Args:
             path: Path to the source file
             
         Returns:
             SourceInfo object with extracted information
         """
-        path_obj = Path(path)
+        exists, size, ctime, mtime, abs_path = self._stat_path(path)
         
         file_size = None
         created_time = None
         modified_time = None
         
-        # Try to get file stats if the file exists
-        if path_obj.exists():
-            stat = path_obj.stat()
-            
+        if exists:
             if self.include_size:
-                file_size = stat.st_size
+                file_size = size
             
             if self.include_timestamps:
-                modified_time = datetime.fromtimestamp(stat.st_mtime)
+                modified_time = mtime
                 # st_ctime is creation time on Windows, change time on Unix
-                created_time = datetime.fromtimestamp(stat.st_ctime)
+                created_time = ctime
         
+        # os.path string functions avoid building a Path object per chunk
+        filename = os.path.basename(path)
         return SourceInfo(
-            path=str(path_obj.absolute()) if path_obj.exists() else path,
-            filename=path_obj.name,
-            extension=path_obj.suffix.lower(),
-            directory=str(path_obj.parent),
+            path=abs_path,
+            filename=filename,
+            extension=os.path.splitext(filename)[1].lower(),
+            directory=os.path.dirname(path) or ".",
             file_size=file_size,
             created_time=created_time,
             modified_time=modified_time,
         )
+    
+    def extract_many(self, paths: List[str]) -> List[SourceInfo]:
+        """Extract source information for many paths at once.
+        
+        Uncached paths are stat()ed concurrently before the SourceInfo
+        objects are built, which overlaps the filesystem round-trips when
+        ingesting many files.
+        
+        Args:
+            paths: Paths to the source files
+            
+        Returns:
+            SourceInfo objects in the same order as paths
+        """
+        self.prefetch(paths)
+        return [self.extract_from_path(path) for path in paths]
+    
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """Stat uncached paths concurrently and store the results.
+        
+        Args:
+            paths: Paths to the source files (duplicates are ignored)
+        """
+        pending = [path for path in dict.fromkeys(paths) if path not in self._stat_cache]
+        if len(pending) < 2:
+            # Nothing to overlap; extract_from_path stats lazily
+            return
+        
+        workers = min(self.STAT_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for path, result in zip(pending, pool.map(self._stat_uncached, pending)):
+                self._cache_stat(path, result)
+    
+    def clear_cache(self) -> None:
+        """Forget cached file stats."""
+        self._stat_cache.clear()
+    
+    def _stat_path(
+        self, path: str
+    ) -> Tuple[bool, Optional[int], Optional[float], Optional[float], str]:
+        """Stat a path, reusing the cached result when available.
+        
+        Args:
+            path: Path to the source file
+            
+        Returns:
+            Tuple of (exists, size, ctime, mtime, absolute path). The absolute
+            path is the input path unchanged if the file does not exist.
+        """
+        cached = self._stat_cache.get(path)
+        if cached is not None:
+            return cached
+        
+        result = self._stat_uncached(path)
+        self._cache_stat(path, result)
+        return result
+    
+    @staticmethod
+    def _stat_uncached(
+        path: str,
+    ) -> Tuple[bool, Optional[int], Optional[float], Optional[float], str]:
+        """Stat a path without consulting the cache (see _stat_path)."""
+        # One stat() call doubles as the existence check
+        try:
+            stat = os.stat(path)
+        except (OSError, ValueError):
+            return (False, None, None, None, path)
+        return (True, stat.st_size, stat.st_ctime, stat.st_mtime, os.path.abspath(path))
+    
+    def _cache_stat(
+        self,
+        path: str,
+        result: Tuple[bool, Optional[int], Optional[float], Optional[float], str],
+    ) -> None:
+        """Store a stat result, resetting the cache once it is full."""
+        if len(self._stat_cache) >= self.STAT_CACHE_SIZE:
+            self._stat_cache.clear()
+        self._stat_cache[path] = result
 
 
-@dataclass
+@dataclass(slots=True)
 class PageInfo:
     """Information about a page within a document.
     
@@ -245,6 +559,12 @@ class PageExtractor(MetadataExtractor):
         
         return {"page_info": page_info.to_dict()}
     
+    def shared_key(self, existing_metadata: Optional[Dict[str, Any]] = None) -> Optional[Hashable]:
+        """Page results depend on the page number and count alone."""
+        if not existing_metadata:
+            return ()
+        return (existing_metadata.get("page_number"), existing_metadata.get("total_pages"))
+    
     def extract_page_info(
         self,
         page_number: Optional[int],
@@ -275,7 +595,7 @@ class PageExtractor(MetadataExtractor):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionInfo:
     """Information about a section within a document.
     
@@ -314,19 +634,14 @@ class SectionExtractor(MetadataExtractor):
     - HTML-style headings (<h1>Heading</h1>)
     - Underline-style headings (Heading followed by === or ---)
     
+    All three syntaxes are found by the module's single fused heading
+    scan (_scan_headings); there are no per-syntax patterns.
+    
     Attributes:
-        heading_patterns: List of regex patterns for heading detection
+        use_hierarchy: Whether to track section hierarchy
     """
     
-    # Markdown ATX-style headings: # Heading
-    MARKDOWN_ATX_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)(?:\s*#*)?$', re.MULTILINE)
-    
-    # Markdown Setext-style headings: Heading followed by === or ---
-    MARKDOWN_SETEXT_H1_PATTERN = re.compile(r'^(.+)\n={3,}\s*$', re.MULTILINE)
-    MARKDOWN_SETEXT_H2_PATTERN = re.compile(r'^(.+)\n-{3,}\s*$', re.MULTILINE)
-    
-    # HTML headings: <h1>Heading</h1>
-    HTML_HEADING_PATTERN = re.compile(r'<h([1-6])[^>]*>(.+?)</h\1>', re.IGNORECASE | re.DOTALL)
+    uses_headings = True
     
     def __init__(self, use_hierarchy: bool = True) -> None:
         """Initialize the section extractor.
@@ -336,12 +651,19 @@ class SectionExtractor(MetadataExtractor):
         """
         self.use_hierarchy = use_hierarchy
     
-    def extract(self, content: str, existing_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def extract(
+        self,
+        content: str,
+        existing_metadata: Optional[Dict[str, Any]] = None,
+        precomputed_headings: Optional[List[Tuple[int, str, int, str]]] = None,
+    ) -> Dict[str, Any]:
         """Extract section metadata from content.
         
         Args:
             content: The text content to analyze
             existing_metadata: Any existing metadata (may contain 'section')
+            precomputed_headings: (level, title, position, syntax) tuples for all
+                headings in content, used instead of scanning it again
             
         Returns:
             Dictionary with section information
@@ -355,10 +677,22 @@ class SectionExtractor(MetadataExtractor):
             return {"section_info": section_info.to_dict()}
         
         # Extract section from content
-        section_info = self.extract_section_from_content(content)
+        if precomputed_headings is not None:
+            section_info = SectionInfo()
+            if precomputed_headings:
+                level, title, _, _ = precomputed_headings[0]
+                section_info = SectionInfo(section_title=title, section_level=level)
+        else:
+            section_info = self.extract_section_from_content(content)
         
         return {"section_info": section_info.to_dict()}
     
+    def cache_key(self, existing_metadata: Optional[Dict[str, Any]] = None) -> Optional[Hashable]:
+        """Section results depend on the content and any given section."""
+        if not existing_metadata:
+            return ()
+        return (existing_metadata.get("section"), existing_metadata.get("section_level"))
+    
     def extract_section_from_content(self, content: str) -> SectionInfo:
         """Extract section information from content.
         
@@ -370,47 +704,16 @@ class SectionExtractor(MetadataExtractor):
         Returns:
             SectionInfo with extracted information
         """
-        # Try markdown ATX-style first
-        match = self.MARKDOWN_ATX_PATTERN.search(content)
-        if match:
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            return SectionInfo(
-                section_title=title,
-                section_level=level,
-            )
-        
-        # Try markdown Setext-style H1
-        match = self.MARKDOWN_SETEXT_H1_PATTERN.search(content)
-        if match:
-            title = match.group(1).strip()
-            return SectionInfo(
-                section_title=title,
-                section_level=1,
-            )
-        
-        # Try markdown Setext-style H2
-        match = self.MARKDOWN_SETEXT_H2_PATTERN.search(content)
-        if match:
-            title = match.group(1).strip()
-            return SectionInfo(
-                section_title=title,
-                section_level=2,
-            )
-        
-        # Try HTML headings
-        match = self.HTML_HEADING_PATTERN.search(content)
-        if match:
-            level = int(match.group(1))
-            title = match.group(2).strip()
-            # Remove any nested HTML tags
-            title = re.sub(r'<[^>]+>', '', title)
-            return SectionInfo(
-                section_title=title,
-                section_level=level,
-            )
-        
-        return SectionInfo()
+        # One fused search; stops at the earliest heading of any syntax
+        first = next(_scan_headings(content), None)
+        if first is None:
+            return SectionInfo()
+        
+        level, title, _, _ = first
+        return SectionInfo(
+            section_title=title,
+            section_level=level,
+        )
     
     def extract_all_sections(self, content: str) -> List[SectionInfo]:
         """Extract all sections from content with hierarchy.
@@ -428,7 +731,7 @@ class SectionExtractor(MetadataExtractor):
         # Find all headings
         headings = self._find_all_headings(content)
         
-        for level, title, _ in headings:
+        for level, title, _, _ in headings:
             # Update parent stack
             while parent_stack and parent_stack[-1][0] >= level:
                 parent_stack.pop()
@@ -453,47 +756,20 @@ class SectionExtractor(MetadataExtractor):
         
         return sections
     
-    def _find_all_headings(self, content: str) -> List[Tuple[int, str, int]]:
+    def _find_all_headings(self, content: str) -> List[Tuple[int, str, int, str]]:
         """Find all headings in content with their positions.
         
         Args:
             content: Text content to analyze
             
         Returns:
-            List of (level, title, position) tuples
+            List of (level, title, position, syntax) tuples
         """
-        headings: List[Tuple[int, str, int]] = []
-        
-        # Find markdown ATX-style headings
-        for match in self.MARKDOWN_ATX_PATTERN.finditer(content):
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            headings.append((level, title, match.start()))
-        
-        # Find markdown Setext-style H1
-        for match in self.MARKDOWN_SETEXT_H1_PATTERN.finditer(content):
-            title = match.group(1).strip()
-            headings.append((1, title, match.start()))
-        
-        # Find markdown Setext-style H2
-        for match in self.MARKDOWN_SETEXT_H2_PATTERN.finditer(content):
-            title = match.group(1).strip()
-            headings.append((2, title, match.start()))
-        
-        # Find HTML headings
-        for match in self.HTML_HEADING_PATTERN.finditer(content):
-            level = int(match.group(1))
-            title = re.sub(r'<[^>]+>', '', match.group(2).strip())
-            headings.append((level, title, match.start()))
-        
-        # Sort by position
-        headings.sort(key=lambda x: x[2])
-        
-        return headings
+        return list(_scan_headings(content))
 
 
 
-@dataclass
+@dataclass(slots=True)
 class TitleInfo:
     """Information about a document title.
     
@@ -529,6 +805,8 @@ class TitleExtractor(MetadataExtractor):
         clean_filename: Whether to clean up filename (remove extension, underscores)
     """
     
+    uses_headings = True
+    
     def __init__(
         self,
         fallback_to_filename: bool = True,
@@ -543,29 +821,49 @@ class TitleExtractor(MetadataExtractor):
         self.fallback_to_filename = fallback_to_filename
         self.clean_filename = clean_filename
     
-    def extract(self, content: str, existing_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def extract(
+        self,
+        content: str,
+        existing_metadata: Optional[Dict[str, Any]] = None,
+        precomputed_headings: Optional[List[Tuple[int, str, int, str]]] = None,
+    ) -> Dict[str, Any]:
         """Extract title from content and metadata.
         
         Args:
             content: The text content to analyze
             existing_metadata: Any existing metadata
+            precomputed_headings: (level, title, position, syntax) tuples for all
+                headings in content, used instead of scanning it again
             
         Returns:
             Dictionary with title information
         """
-        title_info = self.extract_title(content, existing_metadata)
+        title_info = self.extract_title(content, existing_metadata, precomputed_headings)
         return {"title_info": title_info.to_dict()}
     
+    def cache_key(self, existing_metadata: Optional[Dict[str, Any]] = None) -> Optional[Hashable]:
+        """Title results depend on the content, given title and source."""
+        if not existing_metadata:
+            return ()
+        return (existing_metadata.get("title"), existing_metadata.get("source"))
+    
     def extract_title(
         self,
         content: str,
         existing_metadata: Optional[Dict[str, Any]] = None,
+        precomputed_headings: Optional[List[Tuple[int, str, int, str]]] = None,
     ) -> TitleInfo:
         """Extract title using multiple strategies.
         
+        Headings are taken from one scan of the content. The H1 strategy
+        prefers an ATX heading, then Setext, then HTML; the first-heading
+        strategy takes the first ATX heading, then the first HTML one.
+        
         Args:
             content: Text content to analyze
             existing_metadata: Existing metadata dictionary
+            precomputed_headings: (level, title, position, syntax) tuples for all
+                headings in content, used instead of scanning it again
             
         Returns:
             TitleInfo with extracted title
@@ -578,8 +876,12 @@ class TitleExtractor(MetadataExtractor):
                 confidence="high",
             )
         
+        headings = precomputed_headings
+        if headings is None:
+            headings = list(_scan_headings(content))
+        
         # Strategy 2: Look for first H1 heading
-        h1_title = self._extract_h1_title(content)
+        h1_title = self._first_title(headings, (_ATX, _SETEXT, _HTML), level=1)
         if h1_title:
             return TitleInfo(
                 title=h1_title,
@@ -587,8 +889,9 @@ class TitleExtractor(MetadataExtractor):
                 confidence="high",
             )
         
-        # Strategy 3: Look for any first heading
-        first_heading = self._extract_first_heading(content)
+        # Strategy 3: Look for any first heading; Setext lines are skipped,
+        # as "para\n---" is more often a paragraph and a rule
+        first_heading = self._first_title(headings, (_ATX, _HTML))
         if first_heading:
             return TitleInfo(
                 title=first_heading,
@@ -610,53 +913,27 @@ class TitleExtractor(MetadataExtractor):
         
         return TitleInfo()
     
-    def _extract_h1_title(self, content: str) -> Optional[str]:
-        """Extract title from H1 heading.
+    @staticmethod
+    def _first_title(
+        headings: List[Tuple[int, str, int, str]],
+        syntaxes: Tuple[str, ...],
+        level: Optional[int] = None,
+    ) -> Optional[str]:
+        """Return the first non-empty heading title, by syntax preference.
         
         Args:
-            content: Text content
+            headings: (level, title, position, syntax) tuples
+            syntaxes: Syntaxes to try, most preferred first
+            level: Only consider headings of this level, if given
             
         Returns:
-            H1 title or None
+            Title of the earliest matching heading of the first syntax
+            that has one, or None
         """
-        # Markdown ATX H1
-        match = re.search(r'^#\s+(.+?)(?:\s*#*)?$', content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-        
-        # Markdown Setext H1
-        match = re.search(r'^(.+)\n={3,}\s*$', content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-        
-        # HTML H1
-        match = re.search(r'<h1[^>]*>(.+?)</h1>', content, re.IGNORECASE | re.DOTALL)
-        if match:
-            title = re.sub(r'<[^>]+>', '', match.group(1))
-            return title.strip()
-        
-        return None
-    
-    def _extract_first_heading(self, content: str) -> Optional[str]:
-        """Extract the first heading of any level.
-        
-        Args:
-            content: Text content
-            
-        Returns:
-            First heading or None
-        """
-        # Markdown ATX any level
-        match = re.search(r'^#{1,6}\s+(.+?)(?:\s*#*)?$', content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-        
-        # HTML any heading level
-        match = re.search(r'<h[1-6][^>]*>(.+?)</h[1-6]>', content, re.IGNORECASE | re.DOTALL)
-        if match:
-            title = re.sub(r'<[^>]+>', '', match.group(1))
-            return title.strip()
-        
+        for syntax in syntaxes:
+            for heading_level, title, _, heading_syntax in headings:
+                if heading_syntax == syntax and title and level in (None, heading_level):
+                    return title
         return None
     
     def _extract_from_filename(self, source: str) -> Optional[str]:
@@ -668,24 +945,21 @@ class TitleExtractor(MetadataExtractor):
         Returns:
             Cleaned filename as title
         """
-        path = Path(source)
-        filename = path.stem  # Filename without extension
+        # Filename without extension
+        filename = os.path.splitext(os.path.basename(source))[0]
         
         if not filename:
             return None
         
         if self.clean_filename:
-            # Replace underscores and hyphens with spaces
-            filename = re.sub(r'[_-]+', ' ', filename)
-            # Remove multiple spaces
-            filename = re.sub(r'\s+', ' ', filename)
-            # Title case
-            filename = filename.strip().title()
+            # Collapse runs of underscores, hyphens and whitespace to one
+            # space in a single pass, then title case
+            filename = _FNAME_CLEAN_RE.sub(' ', filename).strip().title()
         
         return filename if filename else None
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingInfo:
     """Information about a heading in a document.
     
@@ -722,6 +996,18 @@ class HeadingExtractor(MetadataExtractor):
         max_level: Maximum heading level to extract (1-6)
     """
     
+    @property
+    def uses_headings(self) -> bool:
+        """Share the pipeline's heading scan only for the full 1-6 range.
+        
+        A narrowed pattern reads some lines differently from the all-level
+        one (in '===\\n===\\n---' the all-level scan takes the second '==='
+        as an H1 underline, while an H2-only scan makes it the text of an
+        H2), so filtering the shared scan by level would not match a
+        direct call.
+        """
+        return self.min_level <= 1 and self.max_level >= 6
+    
     def __init__(
         self,
         include_line_numbers: bool = True,
@@ -739,114 +1025,120 @@ class HeadingExtractor(MetadataExtractor):
         self.min_level = min_level
         self.max_level = max_level
     
-    def extract(self, content: str, existing_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def extract(
+        self,
+        content: str,
+        existing_metadata: Optional[Dict[str, Any]] = None,
+        precomputed_headings: Optional[List[Tuple[int, str, int, str]]] = None,
+    ) -> Dict[str, Any]:
         """Extract all headings from content.
         
         Args:
             content: The text content to analyze
             existing_metadata: Any existing metadata (not used)
+            precomputed_headings: (level, title, position, syntax) tuples for all
+                headings in content, used instead of scanning it again when
+                the level range is 1-6 (see uses_headings)
             
         Returns:
             Dictionary with list of headings
         """
-        headings = self.extract_headings(content)
+        # Build the dicts straight from the scan; no HeadingInfo objects
+        headings = [
+            {
+                "text": text,
+                "level": level,
+                "position": position,
+                "line_number": line_number,
+            }
+            for level, text, position, line_number in self._scan(content, precomputed_headings)
+        ]
         return {
-            "headings": [h.to_dict() for h in headings],
+            "headings": headings,
             "heading_count": len(headings),
         }
     
-    def extract_headings(self, content: str) -> List[HeadingInfo]:
+    def cache_key(self, existing_metadata: Optional[Dict[str, Any]] = None) -> Optional[Hashable]:
+        """Heading results depend on the content alone."""
+        return ()
+    
+    def compile(self) -> None:
+        """Compile the heading pattern for this extractor's level range."""
+        _compile_heading_pattern(self.min_level, self.max_level)
+    
+    def extract_headings(self, content: Union[str, bytes]) -> List[HeadingInfo]:
         """Extract all headings from content.
         
+        UTF-8 encoded bytes are scanned without decoding the whole content;
+        only heading text is decoded and positions are byte offsets.
+        
         Args:
-            content: Text content to analyze
+            content: Text content, or UTF-8 encoded bytes, to analyze
             
         Returns:
             List of HeadingInfo objects
         """
-        headings: List[HeadingInfo] = []
-        
-        # Build line number lookup if needed
-        line_starts: List[int] = []
-        if self.include_line_numbers:
-            line_starts = [0]
-            for i, char in enumerate(content):
-                if char == '\n':
-                    line_starts.append(i + 1)
-        
-        # Extract markdown ATX headings
-        for match in re.finditer(r'^(#{1,6})\s+(.+?)(?:\s*#*)?$', content, re.MULTILINE):
-            level = len(match.group(1))
-            if self.min_level <= level <= self.max_level:
-                text = match.group(2).strip()
-                position = match.start()
-                line_number = self._get_line_number(position, line_starts) if self.include_line_numbers else None
-                headings.append(HeadingInfo(
-                    text=text,
-                    level=level,
-                    position=position,
-                    line_number=line_number,
-                ))
-        
-        # Extract markdown Setext H1
-        if self.min_level <= 1 <= self.max_level:
-            for match in re.finditer(r'^(.+)\n={3,}\s*$', content, re.MULTILINE):
-                text = match.group(1).strip()
-                position = match.start()
-                line_number = self._get_line_number(position, line_starts) if self.include_line_numbers else None
-                headings.append(HeadingInfo(
-                    text=text,
-                    level=1,
-                    position=position,
-                    line_number=line_number,
-                ))
-        
-        # Extract markdown Setext H2
-        if self.min_level <= 2 <= self.max_level:
-            for match in re.finditer(r'^(.+)\n-{3,}\s*$', content, re.MULTILINE):
-                text = match.group(1).strip()
-                position = match.start()
-                line_number = self._get_line_number(position, line_starts) if self.include_line_numbers else None
-                headings.append(HeadingInfo(
-                    text=text,
-                    level=2,
-                    position=position,
-                    line_number=line_number,
-                ))
-        
-        # Extract HTML headings
-        for match in re.finditer(r'<h([1-6])[^>]*>(.+?)</h\1>', content, re.IGNORECASE | re.DOTALL):
-            level = int(match.group(1))
-            if self.min_level <= level <= self.max_level:
-                text = re.sub(r'<[^>]+>', '', match.group(2)).strip()
-                position = match.start()
-                line_number = self._get_line_number(position, line_starts) if self.include_line_numbers else None
-                headings.append(HeadingInfo(
-                    text=text,
-                    level=level,
-                    position=position,
-                    line_number=line_number,
-                ))
-        
-        # Sort by position
-        headings.sort(key=lambda h: h.position)
-        
-        return headings
-    
-    def _get_line_number(self, position: int, line_starts: List[int]) -> int:
-        """Get line number for a character position.
+        return list(self.iter_headings(content))
+    
+    def iter_headings(self, content: Union[str, bytes]) -> Iterator[HeadingInfo]:
+        """Iterate over headings in content without building a list.
         
         Args:
-            position: Character position
-            line_starts: List of line start positions
+            content: Text content, or UTF-8 encoded bytes, to analyze
             
-        Returns:
-            Line number (1-indexed)
+        Yields:
+            HeadingInfo objects in document order
+        """
+        for level, text, position, line_number in self._scan(content):
+            yield HeadingInfo(
+                text=text,
+                level=level,
+                position=position,
+                line_number=line_number,
+            )
+    
+    def _scan(
+        self,
+        content: Union[str, bytes],
+        precomputed_headings: Optional[List[Tuple[int, str, int, str]]] = None,
+    ) -> Iterator[Tuple[int, str, int, Optional[int]]]:
+        """Scan content for in-range headings as plain tuples.
+        
+        Args:
+            content: Text content, or UTF-8 encoded bytes, to analyze
+            precomputed_headings: Optional all-level heading tuples, used
+                instead of scanning content when the range is 1-6
+            
+        Yields:
+            (level, text, position, line_number) tuples in document order;
+            line_number is None unless include_line_numbers is set
         """
-        for i, start in enumerate(line_starts):
-            if start > position:
-                return i  # Previous line (1-indexed)
-        return len(line_starts)  # Last line
+        include_line_numbers = self.include_line_numbers
+        as_bytes = isinstance(content, bytes)
+        newline = b'\n' if as_bytes else '\n'
+        
+        # Headings arrive in document order, so line numbers are counted
+        # incrementally with str.count between consecutive headings: the
+        # content is only scanned up to the last heading and no offset
+        # table is built
+        line_number = 1
+        counted_to = 0
+        
+        if precomputed_headings is not None and self.uses_headings:
+            headings: Iterable[Tuple[int, str, int, str]] = precomputed_headings
+        else:
+            # Pattern specialized to [min_level, max_level], compiled once
+            # per range; every match it yields is in range
+            pattern = _compile_heading_pattern(self.min_level, self.max_level, as_bytes)
+            headings = _scan_headings(content, pattern)
+        
+        for level, text, position, _ in headings:
+            if include_line_numbers:
+                line_number += content.count(newline, counted_to, position)
+                counted_to = position
+                yield level, text, position, line_number
+            else:
+                yield level, text, position, None
     
     def get_table_of_contents(self, content: str) -> List[Dict[str, Any]]:
         """Generate a table of contents from headings.
@@ -857,10 +1149,9 @@ class HeadingExtractor(MetadataExtractor):
         Returns:
             List of TOC entries with text, level, and indent
         """
-        headings = self.extract_headings(content)
         toc: List[Dict[str, Any]] = []
         
-        for heading in headings:
+        for heading in self.iter_headings(content):
             indent = "  " * (heading.level - 1)
             toc.append({
                 "text": heading.text,
@@ -883,12 +1174,27 @@ class MetadataEnrichmentPipeline:
     Attributes:
         extractors: List of metadata extractors to apply
         merge_strategy: How to handle conflicting metadata ('first', 'last', 'merge')
+        n_workers: Worker processes used by enrich_documents()/enrich_chunks()
+        executor: Optional caller-owned executor used instead of the pool
+        cache_results: Whether extractor results are memoized per content
     """
     
+    # Batches smaller than this are enriched serially; pool start-up and
+    # pickling would cost more than the parallelism saves
+    PARALLEL_THRESHOLD = 64
+    
+    # Memoized extractor results; content longer than EXTRACT_CACHE_MAX_CONTENT
+    # is not cached so the cache's memory stays bounded
+    EXTRACT_CACHE_SIZE = 4096
+    EXTRACT_CACHE_MAX_CONTENT = 64 * 1024
+    
     def __init__(
         self,
         extractors: Optional[List[MetadataExtractor]] = None,
         merge_strategy: str = "merge",
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+        cache_results: bool = False,
     ) -> None:
         """Initialize the enrichment pipeline.
         
@@ -898,6 +1204,16 @@ class MetadataEnrichmentPipeline:
                 - 'first': Keep first non-None value
                 - 'last': Keep last non-None value
                 - 'merge': Merge dictionaries, last value wins for conflicts
+            n_workers: Number of worker processes for batch enrichment;
+                1 enriches serially
+            executor: Executor to fan batches out to instead, e.g. a
+                ThreadPoolExecutor when SourceExtractor stat() calls on a
+                network filesystem dominate; batches are split into about
+                four tasks per n_workers. The caller owns its lifetime.
+            cache_results: Memoize results of extractors with a cache_key()
+                per content, so repeated boilerplate (headers, footers) is
+                only scanned once. Off by default; the cache holds up to
+                EXTRACT_CACHE_SIZE contents.
         """
         if extractors is None:
             # Default set of extractors
@@ -909,14 +1225,86 @@ class MetadataEnrichmentPipeline:
                 HeadingExtractor(),
             ]
         
+        # (extractor, config_key, content, cache_key) -> extract() result;
+        # the key holds the extractor itself so its id cannot be reused
+        self._extract_cache: Dict[
+            Tuple[MetadataExtractor, Hashable, str, Hashable], Dict[str, Any]
+        ] = {}
+        
+        # Worker pool for batch enrichment, created on first use
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._pool_config: Optional[Hashable] = None
+        self._pool_finalizer: Optional[weakref.finalize] = None
+        
         self.extractors = extractors
         self.merge_strategy = merge_strategy
+        self.n_workers = n_workers
+        self.executor = executor
+        self.cache_results = cache_results
     
-    def enrich_document(self, document: Document) -> Document:
+    @property
+    def extractors(self) -> List[MetadataExtractor]:
+        """Extractors applied in order.
+        
+        Returns a copy; use add_extractor(), remove_extractor() or assign
+        a new list to change them.
+        """
+        return list(self._extractors)
+    
+    @extractors.setter
+    def extractors(self, extractors: Iterable[MetadataExtractor]) -> None:
+        # Stored as a tuple: iterated for every item and never mutated in
+        # place, so _run_extractors cannot see a list changing under it
+        self._extractors = tuple(extractors)
+        for extractor in self._extractors:
+            extractor.compile()
+        # Workers hold a copy of the old extractors, and cached results are
+        # keyed by extractor id, which may be reused
+        self.close()
+        self.clear_cache()
+    
+    @property
+    def merge_strategy(self) -> str:
+        """How conflicting metadata is merged ('first', 'last', 'merge')."""
+        return self._merge_strategy
+    
+    @merge_strategy.setter
+    def merge_strategy(self, strategy: str) -> None:
+        # Resolve the strategy once here rather than on every merge;
+        # unknown names fall back to 'merge' as before
+        self._merge_strategy = strategy
+        self._merge_fn = {
+            "first": self._merge_first,
+            "last": self._merge_last,
+        }.get(strategy, self._merge_deep)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without executors, which cannot cross processes."""
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state["_extract_cache"] = {}
+        state["_pool"] = None
+        state["_pool_workers"] = 0
+        state["_pool_config"] = None
+        state["_pool_finalizer"] = None
+        return state
+    
+    def enrich_document(
+        self,
+        document: Document,
+        inplace: bool = False,
+        shared_results: Optional[Dict[Tuple[int, Hashable], Dict[str, Any]]] = None,
+    ) -> Document:
         """Enrich a document with additional metadata.
         
         Args:
             document: The document to enrich
+            inplace: Update the document's extra dict directly instead of a
+                copy. The returned document then shares that dict with the
+                input, which the caller should discard.
+            shared_results: Batch-wide store letting content-independent
+                extractors run once per source rather than per document
             
         Returns:
             New Document with enriched metadata
@@ -925,18 +1313,21 @@ class MetadataEnrichmentPipeline:
         existing_metadata = document.metadata.to_dict()
         
         # Run all extractors
-        enriched = self._run_extractors(document.content, existing_metadata)
+        enriched = self._run_extractors(document.content, existing_metadata, shared_results)
         
         # Merge enriched metadata into extra field
-        new_extra = document.metadata.extra.copy()
+        new_extra = document.metadata.extra if inplace else document.metadata.extra.copy()
         new_extra.update(enriched)
         
+        title_info = enriched.get("title_info")
+        title = (title_info.get("title") if title_info else None) or document.metadata.title
+        
         # Create new metadata with enriched extra
         new_metadata = DocumentMetadata(
             source=document.metadata.source,
             page_number=document.metadata.page_number,
             total_pages=document.metadata.total_pages,
-            title=enriched.get("title_info", {}).get("title") or document.metadata.title,
+            title=title,
             author=document.metadata.author,
             created_date=document.metadata.created_date,
             modified_date=document.metadata.modified_date,
@@ -946,12 +1337,27 @@ class MetadataEnrichmentPipeline:
         
         return Document(content=document.content, metadata=new_metadata)
     
-    def enrich_chunk(self, chunk: Chunk, document: Optional[Document] = None) -> Chunk:
+    def enrich_chunk(
+        self,
+        chunk: Chunk,
+        document: Optional[Document] = None,
+        doc_meta: Optional[Dict[str, Any]] = None,
+        inplace: bool = False,
+        shared_results: Optional[Dict[Tuple[int, Hashable], Dict[str, Any]]] = None,
+    ) -> Chunk:
         """Enrich a chunk with additional metadata.
         
         Args:
             chunk: The chunk to enrich
             document: Optional parent document for context
+            doc_meta: Parent document context from _document_context(),
+                computed once by callers enriching many chunks of the
+                same document; takes precedence over document
+            inplace: Update the chunk's extra dict directly instead of a
+                copy. The returned chunk then shares that dict with the
+                input, which the caller should discard.
+            shared_results: Batch-wide store letting content-independent
+                extractors run once per source rather than per chunk
             
         Returns:
             New Chunk with enriched metadata
@@ -960,25 +1366,22 @@ class MetadataEnrichmentPipeline:
         existing_metadata = chunk.metadata.to_dict()
         
         # Add document metadata if available
-        if document:
-            doc_meta = document.metadata.to_dict()
-            existing_metadata.update({
-                "doc_title": doc_meta.get("title"),
-                "doc_author": doc_meta.get("author"),
-                "total_pages": doc_meta.get("total_pages"),
-            })
+        if doc_meta is None and document:
+            doc_meta = self._document_context(document)
+        if doc_meta:
+            existing_metadata.update(doc_meta)
         
         # Run all extractors
-        enriched = self._run_extractors(chunk.content, existing_metadata)
+        enriched = self._run_extractors(chunk.content, existing_metadata, shared_results)
         
         # Merge enriched metadata into extra field
-        new_extra = chunk.metadata.extra.copy()
+        new_extra = chunk.metadata.extra if inplace else chunk.metadata.extra.copy()
         new_extra.update(enriched)
         
         # Update section if extracted
         section = chunk.metadata.section
-        if "section_info" in enriched and enriched["section_info"].get("section_title"):
-            section = enriched["section_info"]["section_title"]
+        if section_info := enriched.get("section_info"):
+            section = section_info.get("section_title") or section
         
         # Create new metadata with enriched extra
         new_metadata = ChunkMetadata(
@@ -995,55 +1398,347 @@ class MetadataEnrichmentPipeline:
         
         return Chunk(content=chunk.content, metadata=new_metadata, id=chunk.id)
     
-    def enrich_documents(self, documents: List[Document]) -> List[Document]:
+    def enrich_documents(
+        self,
+        documents: List[Document],
+        inplace: bool = False,
+    ) -> List[Document]:
         """Enrich multiple documents.
         
         Args:
             documents: List of documents to enrich
+            inplace: Reuse each document's extra dict (see enrich_document);
+                ignored when enriching in worker processes
             
         Returns:
-            List of enriched documents
+            List of enriched documents, in input order
         """
-        return [self.enrich_document(doc) for doc in documents]
+        # Source and page metadata are extracted once per distinct value
+        # across the batch; see MetadataExtractor.shared_key()
+        shared_results: Dict[Tuple[int, Hashable], Dict[str, Any]] = {}
+        
+        if self.executor is not None:
+            self._prefetch_sources(doc.metadata.source for doc in documents)
+            return list(self.executor.map(
+                partial(self.enrich_document, inplace=inplace, shared_results=shared_results),
+                documents,
+                chunksize=self._chunksize(len(documents), self.n_workers),
+            ))
+        
+        if self.n_workers > 1 and len(documents) >= self.PARALLEL_THRESHOLD:
+            return self._map_in_pool(_enrich_document_in_worker, documents, self.n_workers)
+        
+        self._prefetch_sources(doc.metadata.source for doc in documents)
+        return [self.enrich_document(doc, inplace, shared_results) for doc in documents]
     
     def enrich_chunks(
         self,
         chunks: List[Chunk],
         document: Optional[Document] = None,
+        inplace: bool = False,
     ) -> List[Chunk]:
         """Enrich multiple chunks.
         
         Args:
             chunks: List of chunks to enrich
             document: Optional parent document for context
+            inplace: Reuse each chunk's extra dict (see enrich_chunk);
+                ignored when enriching in worker processes
+            
+        Returns:
+            List of enriched chunks, in input order
+        """
+        # The parent document's context is the same for every chunk
+        doc_meta = self._document_context(document) if document else None
+        
+        if self.executor is not None:
+            self._prefetch_sources(chunk.metadata.source for chunk in chunks)
+            return list(self.executor.map(
+                partial(
+                    self.enrich_chunk,
+                    doc_meta=doc_meta,
+                    inplace=inplace,
+                    shared_results={},
+                ),
+                chunks,
+                chunksize=self._chunksize(len(chunks), self.n_workers),
+            ))
+        
+        if self.n_workers > 1 and len(chunks) >= self.PARALLEL_THRESHOLD:
+            return self._map_in_pool(_enrich_chunk_in_worker, chunks, self.n_workers, doc_meta)
+        
+        return self._enrich_chunks_serial(chunks, doc_meta, inplace)
+    
+    def iter_enrich_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        document: Optional[Document] = None,
+        inplace: bool = False,
+    ) -> Iterator[Chunk]:
+        """Enrich chunks as a stream instead of building a list.
+        
+        Each chunk is enriched when the consumer asks for it, so a writer
+        (e.g. an embedding step) can release chunks as it goes and memory
+        stays flat for very large inputs. Chunks are enriched serially in
+        this process; n_workers and executor are not used.
+        
+        Args:
+            chunks: Chunks to enrich, from any iterable
+            document: Optional parent document for context
+            inplace: Reuse each chunk's extra dict (see enrich_chunk)
+            
+        Yields:
+            Enriched chunks, in input order
+        """
+        doc_meta = self._document_context(document) if document else None
+        return self._iter_enrich_chunks(chunks, doc_meta, inplace)
+    
+    def __enter__(self) -> "MetadataEnrichmentPipeline":
+        """Use the pipeline as a context manager that closes its pool."""
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Shut down the worker pool on leaving the with block."""
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the pipeline's own worker pool, if any.
+        
+        Called on leaving a with block; a pool still running when the
+        pipeline is garbage collected or the interpreter exits is shut
+        down then. A caller-supplied executor is left running.
+        """
+        if self._pool is not None:
+            self._pool_finalizer.detach()
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
+            self._pool_config = None
+            self._pool_finalizer = None
+    
+    def _enrich_chunks_serial(
+        self,
+        chunks: List[Chunk],
+        doc_meta: Optional[Dict[str, Any]] = None,
+        inplace: bool = False,
+    ) -> List[Chunk]:
+        """Enrich chunks one after another in this process.
+        
+        Args:
+            chunks: List of chunks to enrich
+            doc_meta: Optional parent document context
+            inplace: Reuse each chunk's extra dict
             
         Returns:
             List of enriched chunks
         """
-        return [self.enrich_chunk(chunk, document) for chunk in chunks]
+        self._prefetch_sources(chunk.metadata.source for chunk in chunks)
+        return list(self._iter_enrich_chunks(chunks, doc_meta, inplace))
+    
+    def _iter_enrich_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        doc_meta: Optional[Dict[str, Any]] = None,
+        inplace: bool = False,
+    ) -> Iterator[Chunk]:
+        """Enrich chunks lazily, one at a time, in this process.
+        
+        Args:
+            chunks: Chunks to enrich
+            doc_meta: Optional parent document context
+            inplace: Reuse each chunk's extra dict
+            
+        Yields:
+            Enriched chunks, in input order
+        """
+        # Chunks of one source share their source (and often page) metadata,
+        # so content-independent extractors run once per distinct value
+        shared_results: Dict[Tuple[int, Hashable], Dict[str, Any]] = {}
+        for chunk in chunks:
+            yield self.enrich_chunk(
+                chunk, doc_meta=doc_meta, inplace=inplace, shared_results=shared_results
+            )
+    
+    @staticmethod
+    def _document_context(document: Document) -> Dict[str, Any]:
+        """Build the parent document fields added to each chunk's metadata.
+        
+        Reads the fields directly rather than through to_dict(), which
+        would copy every field and format the dates only to drop them.
+        
+        Args:
+            document: Parent document
+            
+        Returns:
+            Dictionary with doc_title, doc_author and total_pages
+        """
+        metadata = document.metadata
+        return {
+            "doc_title": metadata.title,
+            "doc_author": metadata.author,
+            "total_pages": metadata.total_pages,
+        }
+    
+    def _map_in_pool(
+        self,
+        worker_fn: Any,
+        items: List[Any],
+        workers: int,
+        *shared: Any,
+    ) -> List[Any]:
+        """Fan items out to the worker pool, preserving input order.
+        
+        Args:
+            worker_fn: Module-level worker function to call per item
+            items: Documents or chunks to enrich
+            workers: Number of worker processes
+            *shared: Extra arguments passed unchanged with every item
+            
+        Returns:
+            Worker results, in input order
+        """
+        pool = self._get_pool(workers)
+        chunksize = self._chunksize(len(items), workers)
+        return list(pool.map(
+            worker_fn,
+            items,
+            *(repeat(arg) for arg in shared),
+            chunksize=chunksize,
+        ))
+    
+    @staticmethod
+    def _chunksize(count: int, workers: int) -> int:
+        """Items per task: about four tasks per worker to amortize IPC.
+        
+        Args:
+            count: Number of items in the batch
+            workers: Number of workers sharing the batch
+            
+        Returns:
+            Chunk size for Executor.map()
+        """
+        return max(1, count // (max(workers, 1) * 4))
+    
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return the worker pool, (re)starting it when it is out of date.
+        
+        Workers hold the copy of this pipeline pickled when the pool
+        started, so the pool is restarted for a new worker count and
+        whenever the merge strategy or any extractor setting has changed
+        since.
+        
+        Args:
+            workers: Number of worker processes
+            
+        Returns:
+            A pool whose workers each hold a copy of this pipeline
+        """
+        config = self._config_key()
+        if self._pool is None or self._pool_workers != workers or self._pool_config != config:
+            self.close()
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_enrichment_worker,
+                # Pickled up front so the pool never references the
+                # pipeline, which the finalizer below must not keep alive
+                initargs=(pickle.dumps(self),),
+            )
+            self._pool_workers = workers
+            self._pool_config = config
+            # Shut the workers down if the pipeline is dropped unclosed;
+            # the callback holds the pool, never the pipeline
+            self._pool_finalizer = weakref.finalize(self, self._pool.shutdown, wait=False)
+        return self._pool
+    
+    def _config_key(self) -> Hashable:
+        """Snapshot the settings worker copies of this pipeline depend on."""
+        return self._merge_strategy, tuple(e.config_key() for e in self._extractors)
+    
+    def _prefetch_sources(self, sources: Iterable[str]) -> None:
+        """Warm the stat cache of every SourceExtractor for a batch.
+        
+        Args:
+            sources: Source paths of the items about to be enriched
+        """
+        source_extractors = [e for e in self._extractors if isinstance(e, SourceExtractor)]
+        if not source_extractors:
+            return
+        
+        paths = list(dict.fromkeys(sources))
+        for extractor in source_extractors:
+            extractor.prefetch(paths)
     
     def _run_extractors(
         self,
         content: str,
         existing_metadata: Dict[str, Any],
+        shared_results: Optional[Dict[Tuple[int, Hashable], Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Run all extractors and merge results.
         
+        With cache_results set, results of cacheable extractors are
+        memoized per content. Results of content-independent extractors
+        are reused across a batch through shared_results. Stored results
+        are always merged as copies.
+        
         Args:
             content: Text content to analyze
             existing_metadata: Existing metadata dictionary
+            shared_results: Per-batch store for extractors with a
+                shared_key(), filled and reused across calls
             
         Returns:
             Merged extraction results
         """
         result: Dict[str, Any] = {}
         
-        for extractor in self.extractors:
+        # Heading-aware extractors share a single scan of the content,
+        # done on first use so pipelines without them never pay for it
+        headings: Optional[List[Tuple[int, str, int, str]]] = None
+        cacheable = self.cache_results and len(content) <= self.EXTRACT_CACHE_MAX_CONTENT
+        
+        for extractor in self._extractors:
             try:
-                extracted = extractor.extract(content, existing_metadata)
-                result = self._merge_metadata(result, extracted)
-            except Exception:
+                store: Optional[Dict[Any, Dict[str, Any]]] = None
+                key: Any = None
+                shared_key = None
+                if shared_results is not None:
+                    shared_key = extractor.shared_key(existing_metadata)
+                if shared_key is not None:
+                    store, key = shared_results, (id(extractor), shared_key)
+                elif cacheable:
+                    metadata_key = extractor.cache_key(existing_metadata)
+                    if metadata_key is not None:
+                        store = self._extract_cache
+                        key = (extractor, extractor.config_key(), content, metadata_key)
+                
+                if store is not None:
+                    cached = store.get(key)
+                    if cached is not None:
+                        # Stored results are copied so enriched items never
+                        # share (and edit) one another's nested objects
+                        self._merge_fn(result, copy.deepcopy(cached))
+                        continue
+                
+                if extractor.uses_headings:
+                    if headings is None:
+                        headings = list(_scan_headings(content))
+                    extracted = extractor.extract(
+                        content, existing_metadata, precomputed_headings=headings
+                    )
+                else:
+                    extracted = extractor.extract(content, existing_metadata)
+                
+                if store is not None:
+                    if store is self._extract_cache and len(store) >= self.EXTRACT_CACHE_SIZE:
+                        store.clear()
+                    store[key] = extracted
+                    extracted = copy.deepcopy(extracted)
+                self._merge_fn(result, extracted)
+            except _EXTRACTOR_ERRORS as e:
                 # Skip failed extractors
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Extractor %s failed: %s", type(extractor).__name__, e)
                 continue
         
         return result
@@ -1062,31 +1757,39 @@ class MetadataEnrichmentPipeline:
         Returns:
             Merged dictionary
         """
-        if self.merge_strategy == "first":
-            # Keep first non-None values
-            result = base.copy()
-            for key, value in new.items():
-                if key not in result or result[key] is None:
-                    result[key] = value
-            return result
-        
-        elif self.merge_strategy == "last":
-            # Keep last non-None values
-            result = base.copy()
-            for key, value in new.items():
-                if value is not None:
-                    result[key] = value
-            return result
-        
-        else:  # merge
-            # Deep merge dictionaries
-            result = base.copy()
-            for key, value in new.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = self._merge_metadata(result[key], value)
-                elif value is not None:
-                    result[key] = value
-            return result
+        result = base.copy()
+        self._merge_fn(result, new)
+        return result
+    
+    @staticmethod
+    def _merge_first(base: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Merge in place, keeping the first non-None value per key."""
+        for key, value in new.items():
+            if base.get(key) is None:
+                base[key] = value
+    
+    @staticmethod
+    def _merge_last(base: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Merge in place, keeping the last non-None value per key."""
+        for key, value in new.items():
+            if value is not None:
+                base[key] = value
+    
+    @classmethod
+    def _merge_deep(cls, base: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Merge in place, recursing into dictionaries; last value wins.
+        
+        Nested dictionaries may belong to an extractor and are copied
+        before being merged into.
+        """
+        for key, value in new.items():
+            current = base.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                nested = current.copy()
+                cls._merge_deep(nested, value)
+                base[key] = nested
+            elif value is not None:
+                base[key] = value
     
     def add_extractor(self, extractor: MetadataExtractor) -> None:
         """Add an extractor to the pipeline.
@@ -1094,7 +1797,7 @@ class MetadataEnrichmentPipeline:
         Args:
             extractor: Extractor to add
         """
-        self.extractors.append(extractor)
+        self.extractors = self._extractors + (extractor,)
     
     def remove_extractor(self, extractor_type: type) -> bool:
         """Remove extractors of a specific type.
@@ -1105,9 +1808,42 @@ class MetadataEnrichmentPipeline:
         Returns:
             True if any extractors were removed
         """
-        original_count = len(self.extractors)
-        self.extractors = [e for e in self.extractors if not isinstance(e, extractor_type)]
-        return len(self.extractors) < original_count
+        kept = tuple(e for e in self._extractors if not isinstance(e, extractor_type))
+        removed = len(kept) < len(self._extractors)
+        if removed:
+            self.extractors = kept
+        return removed
+    
+    def clear_cache(self) -> None:
+        """Forget memoized extractor results."""
+        self._extract_cache.clear()
+
+
+# Pipeline copy installed in each batch enrichment worker process
+_worker_pipeline: Optional[MetadataEnrichmentPipeline] = None
+
+
+def _init_enrichment_worker(pipeline: bytes) -> None:
+    """Install the pickled pipeline in a worker process (pool initializer)."""
+    global _worker_pipeline
+    _worker_pipeline = pickle.loads(pipeline)
+
+
+def _get_worker_pipeline() -> MetadataEnrichmentPipeline:
+    """Return the worker's pipeline, failing if the pool skipped set-up."""
+    if _worker_pipeline is None:
+        raise RuntimeError("Enrichment worker was not initialized")
+    return _worker_pipeline
+
+
+def _enrich_chunk_in_worker(chunk: Chunk, doc_meta: Optional[Dict[str, Any]] = None) -> Chunk:
+    """Enrich one chunk with the worker's pipeline."""
+    return _get_worker_pipeline().enrich_chunk(chunk, doc_meta=doc_meta)
+
+
+def _enrich_document_in_worker(document: Document) -> Document:
+    """Enrich one document with the worker's pipeline."""
+    return _get_worker_pipeline().enrich_document(document)
 
 
 def create_default_pipeline() -> MetadataEnrichmentPipeline:
@@ -7,10 +7,74 @@ the document ingestion pipeline.
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+import json
+import sys
 
+# Optional C JSON codec; probed once here, _to_json/_from_json fall back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _intern_optional(value: Any) -> Any:
+    """Intern a metadata string shared by many documents.
+    
+    Args:
+        value: A metadata value, possibly a ``str`` subclass or None
+        
+    Returns:
+        The interned plain string, or the value unchanged if not a string
+    """
+    if isinstance(value, str):
+        return sys.intern(str(value))
+    return value
+
+
+def _to_json(obj: Any) -> bytes:
+    """Serialize a model dataclass (Document, Chunk, ...) to UTF-8 JSON.
+    
+    Encodes obj.to_dict() in C via orjson when installed, otherwise with
+    the json module in the same compact, non-ASCII-escaping layout. Both
+    accept the same values: orjson's extra types (datetimes, dataclasses
+    in extra) are passed through, and anything orjson rejects, such as
+    non-str keys or ints wider than 64 bits, falls back to json. Float
+    spelling (1e16 vs 1e+16) and NaN (null vs NaN) can still differ.
+    """
+    data = obj.to_dict()
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _iso_cached(
+    value: datetime,
+    cached: Optional[Tuple[datetime, str]],
+) -> Tuple[datetime, str]:
+    """Return (value, value.isoformat()), reusing cached if it is for value."""
+    if cached is None or cached[0] is not value:
+        return value, value.isoformat()
+    return cached
+
+
+def _from_json(data: Union[bytes, str]) -> Dict[str, Any]:
+    """Parse JSON produced by _to_json() into a dictionary."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN written by the json fallback
+            pass
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata associated with a loaded document.
     
@@ -34,6 +98,20 @@ class DocumentMetadata:
     modified_date: Optional[datetime] = None
     file_type: Optional[str] = None
     extra: Dict[str, Any] = field(default_factory=dict)
+    # isoformat() strings from to_dict(), kept with the datetime they were
+    # formatted from so that assigning a new date invalidates them
+    _created_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _modified_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Intern low-cardinality strings shared by many documents."""
+        self.source = _intern_optional(self.source)
+        self.file_type = _intern_optional(self.file_type)
+        self.author = _intern_optional(self.author)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary for serialization."""
@@ -47,13 +125,15 @@ class DocumentMetadata:
             "extra": self.extra,
         }
         if self.created_date:
-            result["created_date"] = self.created_date.isoformat()
+            self._created_iso = _iso_cached(self.created_date, self._created_iso)
+            result["created_date"] = self._created_iso[1]
         if self.modified_date:
-            result["modified_date"] = self.modified_date.isoformat()
+            self._modified_iso = _iso_cached(self.modified_date, self._modified_iso)
+            result["modified_date"] = self._modified_iso[1]
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """A loaded document with content and metadata.
     
@@ -102,9 +182,18 @@ class Document:
             metadata_data["modified_date"] = datetime.fromisoformat(metadata_data["modified_date"])
         metadata = DocumentMetadata(**metadata_data)
         return cls(content=data["content"], metadata=metadata)
+    
+    def to_json(self) -> bytes:
+        """Serialize document to UTF-8 JSON (see to_dict for the layout)."""
+        return _to_json(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Document":
+        """Create a Document from JSON produced by to_json()."""
+        return cls.from_dict(_from_json(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMetadata:
     """Metadata associated with a document chunk.
     
@@ -129,6 +218,11 @@ class ChunkMetadata:
     parent_id: Optional[str] = None
     extra: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self) -> None:
+        """Intern strings repeated across the chunks of a document."""
+        self.source = _intern_optional(self.source)
+        self.section = _intern_optional(self.section)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary for serialization."""
         return {
@@ -144,7 +238,7 @@ class ChunkMetadata:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """A chunk of text extracted from a document.
     
@@ -194,3 +288,12 @@ class Chunk:
             metadata=metadata,
             id=data.get("id"),
         )
+    
+    def to_json(self) -> bytes:
+        """Serialize chunk to UTF-8 JSON (see to_dict for the layout)."""
+        return _to_json(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Chunk":
+        """Create a Chunk from JSON produced by to_json()."""
+        return cls.from_dict(_from_json(data))
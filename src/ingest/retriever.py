@@ -9,15 +9,37 @@ This pattern is useful for RAG systems where:
 - Larger parent documents provide better context for generation
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
-import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import binascii
+import os
+import sys
 
-from .models import Chunk, ChunkMetadata, Document, DocumentMetadata
+from .models import Chunk, ChunkMetadata, Document, _from_json, _to_json
 from .chunkers import ChunkingStrategy, FixedSizeChunker, RecursiveChunker
 
 
-@dataclass
+# Value of extra["retrieval_type"] on every child chunk the retriever produces
+RETRIEVAL_TYPE = "parent_document"
+
+
+def _batch_ids(n: int) -> List[str]:
+    """Generate ``n`` random 32-character hex IDs from one urandom draw.
+    
+    Args:
+        n: Number of IDs to generate
+        
+    Returns:
+        List of unique-with-overwhelming-probability hex ID strings
+    """
+    if n <= 0:
+        return []
+    hx = binascii.hexlify(os.urandom(16 * n)).decode("ascii")
+    return [hx[i:i + 32] for i in range(0, 32 * n, 32)]
+
+
+@dataclass(slots=True)
 class ParentChunk:
     """A parent chunk that contains multiple child chunks.
     
@@ -50,14 +72,14 @@ class ParentChunk:
         """Create a ParentChunk from a dictionary."""
         metadata = ChunkMetadata(**data["metadata"])
         return cls(
-            id=data["id"],
+            id=sys.intern(data["id"]),
             content=data["content"],
             metadata=metadata,
-            child_ids=data.get("child_ids", []),
+            child_ids=[sys.intern(cid) for cid in data.get("child_ids", [])],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMapping:
     """Mapping between child chunks and their parent chunks.
     
@@ -74,6 +96,22 @@ class ChunkMapping:
     parent_to_children: Dict[str, List[str]] = field(default_factory=dict)
     parents: Dict[str, ParentChunk] = field(default_factory=dict)
     children: Dict[str, Chunk] = field(default_factory=dict)
+    _child_sets: Dict[str, Set[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def _child_set(self, parent_id: str) -> Set[str]:
+        """Return the membership set mirroring a parent's child list.
+        
+        Built lazily from ``parent_to_children`` so mappings restored via
+        ``from_dict`` (or edited directly) are picked up on first use.
+        """
+        seen = self._child_sets.get(parent_id)
+        if seen is None:
+            seen = self._child_sets[parent_id] = set(
+                self.parent_to_children.setdefault(parent_id, [])
+            )
+        return seen
     
     def add_mapping(
         self,
@@ -86,28 +124,62 @@ class ChunkMapping:
             child_chunk: The child chunk
             parent_chunk: The parent chunk containing the child
         """
-        if child_chunk.id is None:
-            child_chunk.id = str(uuid.uuid4())
+        if not child_chunk.id:
+            child_chunk.id = _batch_ids(1)[0]
         
         child_id = child_chunk.id
-        parent_id = parent_chunk.id
+        parent_id = sys.intern(parent_chunk.id)
         
         # Store the mapping
         self.child_to_parent[child_id] = parent_id
         
-        # Update parent's child list
-        if parent_id not in self.parent_to_children:
-            self.parent_to_children[parent_id] = []
-        if child_id not in self.parent_to_children[parent_id]:
+        # Update both child lists; the set keeps the membership test O(1)
+        seen = self._child_set(parent_id)
+        if child_id not in seen:
+            seen.add(child_id)
             self.parent_to_children[parent_id].append(child_id)
+            parent_chunk.child_ids.append(child_id)
         
         # Store the chunks
         self.children[child_id] = child_chunk
         self.parents[parent_id] = parent_chunk
+    
+    def add_mappings(
+        self,
+        child_chunks: List[Chunk],
+        parent_chunk: ParentChunk,
+    ) -> None:
+        """Add child-to-parent mappings for a batch of children.
         
-        # Update parent's child_ids list
-        if child_id not in parent_chunk.child_ids:
-            parent_chunk.child_ids.append(child_id)
+        Equivalent to calling ``add_mapping`` for each child, but resolves
+        the parent's bookkeeping once and extends its child lists in bulk.
+        
+        Args:
+            child_chunks: The child chunks
+            parent_chunk: The parent chunk containing every child
+        """
+        # One interned string shared by every child_to_parent entry
+        parent_id = sys.intern(parent_chunk.id)
+        child_to_parent = self.child_to_parent
+        children = self.children
+        seen = self._child_set(parent_id)
+        
+        missing = [c for c in child_chunks if not c.id]
+        for child_chunk, child_id in zip(missing, _batch_ids(len(missing))):
+            child_chunk.id = child_id
+        
+        new_ids: List[str] = []
+        for child_chunk in child_chunks:
+            child_id = child_chunk.id
+            child_to_parent[child_id] = parent_id
+            children[child_id] = child_chunk
+            if child_id not in seen:
+                seen.add(child_id)
+                new_ids.append(child_id)
+        
+        self.parent_to_children[parent_id].extend(new_ids)
+        parent_chunk.child_ids.extend(new_ids)
+        self.parents[parent_id] = parent_chunk
     
     def get_parent(self, child_id: str) -> Optional[ParentChunk]:
         """Get the parent chunk for a given child chunk ID.
@@ -132,8 +204,14 @@ class ChunkMapping:
         Returns:
             List of child chunks
         """
-        child_ids = self.parent_to_children.get(parent_id, [])
-        return [self.children[cid] for cid in child_ids if cid in self.children]
+        child_ids = self.parent_to_children.get(parent_id, ())
+        children = self.children
+        try:
+            # The mapping keeps both tables in step, so one lookup per child
+            return [children[cid] for cid in child_ids]
+        except KeyError:
+            # Hand-edited or partial from_dict() data; skip dangling IDs
+            return [children[cid] for cid in child_ids if cid in children]
     
     def get_parents_for_children(self, child_ids: List[str]) -> List[ParentChunk]:
         """Get unique parent chunks for a list of child chunk IDs.
@@ -144,16 +222,19 @@ class ChunkMapping:
         Returns:
             List of unique parent chunks (deduplicated)
         """
-        seen_parent_ids: Set[str] = set()
-        parents: List[ParentChunk] = []
+        # Dict insertion order doubles as the dedup set
+        child_to_parent = self.child_to_parent
+        all_parents = self.parents
+        found: Dict[str, ParentChunk] = {}
         
         for child_id in child_ids:
-            parent = self.get_parent(child_id)
-            if parent is not None and parent.id not in seen_parent_ids:
-                seen_parent_ids.add(parent.id)
-                parents.append(parent)
+            parent_id = child_to_parent.get(child_id)
+            if parent_id is not None and parent_id not in found:
+                parent = all_parents.get(parent_id)
+                if parent is not None:
+                    found[parent_id] = parent
         
-        return parents
+        return list(found.values())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert mapping to dictionary for serialization."""
@@ -167,27 +248,55 @@ class ChunkMapping:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChunkMapping":
         """Create a ChunkMapping from a dictionary."""
+        # JSON decoding yields a fresh string for every occurrence of an
+        # ID; interning makes all tables (and the chunks' own id fields)
+        # share one string per ID again, and lets lookups with the
+        # restored IDs short-circuit on identity
+        intern = sys.intern
         mapping = cls(
-            child_to_parent=data.get("child_to_parent", {}),
-            parent_to_children=data.get("parent_to_children", {}),
+            child_to_parent={
+                intern(cid): intern(pid)
+                for cid, pid in data.get("child_to_parent", {}).items()
+            },
+            parent_to_children={
+                intern(pid): [intern(cid) for cid in cids]
+                for pid, cids in data.get("parent_to_children", {}).items()
+            },
         )
         
         # Reconstruct parents
         for pid, pdata in data.get("parents", {}).items():
-            mapping.parents[pid] = ParentChunk.from_dict(pdata)
+            mapping.parents[intern(pid)] = ParentChunk.from_dict(pdata)
         
         # Reconstruct children
         for cid, cdata in data.get("children", {}).items():
-            mapping.children[cid] = Chunk.from_dict(cdata)
+            child = Chunk.from_dict(cdata)
+            if child.id is not None:
+                child.id = intern(child.id)
+            mapping.children[intern(cid)] = child
         
         return mapping
     
+    def to_json(self) -> bytes:
+        """Serialize mapping to UTF-8 JSON (see to_dict for the layout).
+        
+        Encodes to_dict() through the models' shared JSON helper, using
+        orjson when it is installed.
+        """
+        return _to_json(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "ChunkMapping":
+        """Create a ChunkMapping from JSON produced by to_json()."""
+        return cls.from_dict(_from_json(data))
+    
     def clear(self) -> None:
         """Clear all mappings and stored chunks."""
         self.child_to_parent.clear()
         self.parent_to_children.clear()
         self.parents.clear()
         self.children.clear()
+        self._child_sets.clear()
     
     def __len__(self) -> int:
         """Return the number of child chunks stored."""
@@ -223,12 +332,18 @@ class ParentDocumentRetriever:
         parent_splitter: ChunkingStrategy for creating parent chunks
         child_splitter: ChunkingStrategy for creating child chunks from parents
         mapping: Storage for chunk-to-parent mappings
+        n_workers: Worker processes used by add_documents()
     """
     
+    # Batches smaller than this are split serially; pool start-up and
+    # pickling would cost more than the parallelism saves
+    PARALLEL_THRESHOLD = 4
+    
     def __init__(
         self,
         parent_splitter: Optional[ChunkingStrategy] = None,
         child_splitter: Optional[ChunkingStrategy] = None,
+        n_workers: int = 1,
     ) -> None:
         """Initialize the ParentDocumentRetriever.
         
@@ -237,6 +352,8 @@ class ParentDocumentRetriever:
                 Defaults to RecursiveChunker with chunk_size=2000.
             child_splitter: Strategy for creating child chunks.
                 Defaults to RecursiveChunker with chunk_size=400.
+            n_workers: Number of worker processes add_documents() splits
+                documents across; 1 splits serially
                 
         Raises:
             ValueError: If child chunk size >= parent chunk size
@@ -260,6 +377,7 @@ class ParentDocumentRetriever:
         
         # Initialize mapping storage
         self.mapping = ChunkMapping()
+        self.n_workers = n_workers
     
     def add_document(self, document: Document) -> List[Chunk]:
         """Process a document and return child chunks for indexing.
@@ -276,68 +394,117 @@ class ParentDocumentRetriever:
         Returns:
             List of child chunks (use these for embedding/indexing)
         """
-        all_child_chunks: List[Chunk] = []
+        return self._store_split(self._split_document(document))
+    
+    def _split_document(
+        self,
+        document: Document,
+    ) -> List[Tuple[int, ParentChunk, List[Chunk]]]:
+        """Split a document into parents and their annotated children.
         
+        Touches no retriever state, so it can run in a worker process.
+        
+        Args:
+            document: The document to split
+            
+        Returns:
+            (parent_index, parent, children) for each parent chunk
+        """
         # Create parent chunks from the document
         parent_chunks = self.parent_splitter.chunk(document)
         
+        # Draw IDs for every parent missing one in a single batch
+        fresh_ids = _batch_ids(sum(1 for p in parent_chunks if not p.id))
+        
+        source = document.metadata.source
+        page_number = document.metadata.page_number
+        chunk_text = self.child_splitter.chunk_text
+        
+        split: List[Tuple[int, ParentChunk, List[Chunk]]] = []
         for parent_idx, parent_chunk_data in enumerate(parent_chunks):
             # Create a ParentChunk from the Chunk
             parent_chunk = ParentChunk(
-                id=parent_chunk_data.id or str(uuid.uuid4()),
+                id=parent_chunk_data.id or fresh_ids.pop(),
                 content=parent_chunk_data.content,
                 metadata=parent_chunk_data.metadata,
             )
             
-            # Create a temporary document from the parent chunk content
-            # to split into child chunks
-            parent_doc = Document(
-                content=parent_chunk.content,
-                metadata=DocumentMetadata(
-                    source=document.metadata.source,
-                    page_number=document.metadata.page_number,
-                    file_type=document.metadata.file_type,
-                    extra={
-                        "parent_id": parent_chunk.id,
-                        "parent_index": parent_idx,
-                    },
-                ),
-            )
-            
-            # Create child chunks from the parent
-            child_chunks = self.child_splitter.chunk(parent_doc)
+            # Create child chunks straight from the parent text, without
+            # wrapping it in a throwaway Document
+            child_chunks = chunk_text(parent_chunk.content, source, page_number)
+            split.append((parent_idx, parent_chunk, child_chunks))
+        
+        # Same for the children, so the mapping loop never has to
+        fresh_ids = _batch_ids(
+            sum(1 for _, _, children in split for c in children if not c.id)
+        )
+        
+        for parent_idx, parent_chunk, child_chunks in split:
+            parent_id = parent_chunk.id
+            extras = {"parent_index": parent_idx, "retrieval_type": RETRIEVAL_TYPE}
             
-            # Update child chunk metadata and create mappings
+            # Update child chunk metadata
             for child_chunk in child_chunks:
-                # Ensure child has an ID
-                if child_chunk.id is None:
-                    child_chunk.id = str(uuid.uuid4())
+                # Ensure child has an ID; empty IDs are replaced as for parents
+                if not child_chunk.id:
+                    child_chunk.id = fresh_ids.pop()
                 
                 # Add parent reference to child metadata
-                child_chunk.metadata.parent_id = parent_chunk.id
-                child_chunk.metadata.extra["parent_index"] = parent_idx
-                child_chunk.metadata.extra["retrieval_type"] = "parent_document"
-                
-                # Store the mapping
-                self.mapping.add_mapping(child_chunk, parent_chunk)
-                
-                all_child_chunks.append(child_chunk)
+                metadata = child_chunk.metadata
+                metadata.parent_id = parent_id
+                metadata.extra.update(extras)
         
+        return split
+    
+    def _store_split(
+        self,
+        split: List[Tuple[int, ParentChunk, List[Chunk]]],
+    ) -> List[Chunk]:
+        """Record the mappings for a split document.
+        
+        Args:
+            split: Output of _split_document()
+            
+        Returns:
+            The document's child chunks, in order
+        """
+        all_child_chunks: List[Chunk] = []
+        for _, parent_chunk, child_chunks in split:
+            # Store the mappings for the whole parent at once
+            self.mapping.add_mappings(child_chunks, parent_chunk)
+            all_child_chunks.extend(child_chunks)
         return all_child_chunks
     
     def add_documents(self, documents: List[Document]) -> List[Chunk]:
         """Process multiple documents and return all child chunks.
         
+        With n_workers > 1 and at least PARALLEL_THRESHOLD documents, the
+        splitting runs in worker processes; mappings are always recorded
+        here, in input order. Each such call starts its own process pool
+        and pickles the splitters to it once, so the pool always uses
+        the current splitters; prefer one large batch over many small
+        calls to amortize the start-up.
+        
         Args:
             documents: List of documents to process
             
         Returns:
             List of all child chunks from all documents
         """
+        if self.n_workers > 1 and len(documents) >= self.PARALLEL_THRESHOLD:
+            chunksize = max(1, len(documents) // (self.n_workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_split_worker,
+                initargs=(self.parent_splitter, self.child_splitter),
+            ) as pool:
+                splits = list(pool.map(_split_document_in_worker, documents, chunksize=chunksize))
+        else:
+            splits = [self._split_document(document) for document in documents]
+        
         all_chunks: List[Chunk] = []
-        for document in documents:
-            chunks = self.add_document(document)
-            all_chunks.extend(chunks)
+        for split in splits:
+            all_chunks.extend(self._store_split(split))
         return all_chunks
     
     def get_parent(self, child_id: str) -> Optional[ParentChunk]:
@@ -459,3 +626,26 @@ class ParentDocumentRetriever:
             retriever.mapping = ChunkMapping.from_dict(data["mapping"])
         
         return retriever
+
+
+# Splitter-only retriever installed in each add_documents() worker process
+_worker_retriever: Optional[ParentDocumentRetriever] = None
+
+
+def _init_split_worker(
+    parent_splitter: ChunkingStrategy,
+    child_splitter: ChunkingStrategy,
+) -> None:
+    """Install the splitters in a worker process (pool initializer)."""
+    global _worker_retriever
+    _worker_retriever = ParentDocumentRetriever(
+        parent_splitter=parent_splitter,
+        child_splitter=child_splitter,
+    )
+
+
+def _split_document_in_worker(document: Document) -> List[Tuple[int, ParentChunk, List[Chunk]]]:
+    """Split one document with the worker's splitters."""
+    if _worker_retriever is None:
+        raise RuntimeError("Split worker was not initialized")
+    return _worker_retriever._split_document(document)
@@ -6,12 +6,25 @@ fallback support when libraries are not available.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+import csv
+import importlib
+import io
+import json
+import multiprocessing
 import re
 
+# Optional C JSON encoder; probed once here, _dumps_json falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class TableExtractionMethod(str, Enum):
     """Methods for extracting tables from PDFs."""
@@ -55,6 +68,11 @@ class ExtractedTable:
     headers: Optional[List[str]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Coerce non-string cells given at construction; cells added to the
+        # public data list later are still str()-ed by each converter
+        if any(type(cell) is not str for row in self.data for cell in row):
+            self.data = [[c if isinstance(c, str) else str(c) for c in row] for row in self.data]
 
     @property
     def num_rows(self) -> int:
@@ -62,15 +80,12 @@ class ExtractedTable:
 
     @property
     def num_cols(self) -> int:
-        if not self.data:
-            return 0
-        return max(len(row) for row in self.data)
+        return max(map(len, self.data), default=0)
 
     @property
     def is_empty(self) -> bool:
-        return self.num_rows == 0 or all(
-            all(not cell.strip() for cell in row) for row in self.data
-        )
+        # isspace() tests in place where strip() would copy each cell
+        return all(not cell or cell.isspace() for row in self.data for cell in row)
 
     def get_cell(self, row: int, col: int) -> str:
         if 0 <= row < len(self.data) and 0 <= col < len(self.data[row]):
@@ -123,20 +138,115 @@ class TableExtractor(ABC):
         ...
 
 
+@lru_cache(maxsize=None)
+def _module_available(name: str) -> bool:
+    """Whether an optional extraction library imports; probed once per process."""
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _spec_needs_page_count(pages: str) -> bool:
+    """Whether a camelot page spec refers to "all" or "end" pages."""
+    spec = pages.lower()
+    return "all" in spec or "end" in spec
+
+
+def _parse_pages(pages: str, total_pages: Optional[int] = None) -> List[int]:
+    """Expand a camelot page spec ("all", "1,3,5-end") into sorted, unique page numbers.
+
+    camelot reads sorted(set(pages)), so the same order is returned here.
+    total_pages is only needed when the spec contains "all" or "end".
+    """
+    if _spec_needs_page_count(pages) and total_pages is None:
+        raise ValueError(f"Page spec {pages!r} needs the document's page count")
+    if pages.strip().lower() == "all":
+        return list(range(1, total_pages + 1))
+    numbers: Set[int] = set()
+    for part in pages.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            last = total_pages if end.strip() == "end" else int(end)
+            numbers.update(range(int(start), last + 1))
+        else:
+            numbers.add(total_pages if part == "end" else int(part))
+    return sorted(numbers)
+
+
+def _page_blocks(page_numbers: List[int], n_blocks: int) -> List[str]:
+    """Split pages into up to n_blocks contiguous, near-equal camelot page specs."""
+    n_blocks = max(1, min(n_blocks, len(page_numbers)))
+    size, extra = divmod(len(page_numbers), n_blocks)
+    blocks: List[str] = []
+    start = 0
+    for i in range(n_blocks):
+        end = start + size + (1 if i < extra else 0)
+        block = page_numbers[start:end]
+        start = end
+        # Collapse consecutive runs into ranges ("5-12") for camelot
+        parts: List[str] = []
+        run_start = prev = block[0]
+        for page in block[1:] + [None]:
+            if page is not None and page == prev + 1:
+                prev = page
+                continue
+            parts.append(str(run_start) if run_start == prev else f"{run_start}-{prev}")
+            if page is not None:
+                run_start = prev = page
+        blocks.append(",".join(parts))
+    return blocks
+
+
+def _camelot_to_extracted(tables: Any, flavor: str) -> List[ExtractedTable]:
+    """Convert a camelot TableList into ExtractedTables, numbered in order."""
+    extracted: List[ExtractedTable] = []
+    for idx, table in enumerate(tables):
+        # Table.data is the stripped cell-text grid camelot builds df from;
+        # reading it skips the DataFrame -> ndarray -> list round trip
+        data = table.data if hasattr(table, "data") else table.df.values.tolist()
+        bbox = table._bbox if hasattr(table, "_bbox") else None
+        extracted.append(ExtractedTable(
+            data=data,
+            page_number=table.page,
+            table_index=idx,
+            bbox=bbox,
+            accuracy=table.accuracy if hasattr(table, "accuracy") else 0.0,
+            extraction_method=f"camelot_{flavor}",
+            metadata={"flavor": flavor, "shape": table.shape},
+        ))
+    return extracted
+
+
+def _read_camelot_pages(path: str, pages: str, kwargs: Dict[str, Any]) -> List[ExtractedTable]:
+    """Run camelot over some pages of a PDF (process pool worker)."""
+    import camelot
+    tables = camelot.read_pdf(path, pages=pages, **kwargs)
+    return _camelot_to_extracted(tables, kwargs["flavor"])
+
+
 class CamelotTableExtractor(TableExtractor):
-    """Table extractor using camelot-py library."""
+    """Table extractor using camelot-py library.
 
-    def __init__(self, flavor: str = "lattice", line_scale: int = 15, row_tol: int = 2):
+    With n_workers > 1, multi-page extractions are split into one block of
+    pages per worker process. Ghostscript is not thread-safe, so processes (started with
+    "spawn") are used rather than threads.
+    """
+
+    def __init__(
+        self, flavor: str = "lattice", line_scale: int = 15, row_tol: int = 2, n_workers: int = 1
+    ):
         self.flavor = flavor
         self.line_scale = line_scale
         self.row_tol = row_tol
+        self.n_workers = n_workers
 
     def is_available(self) -> bool:
-        try:
-            import camelot
-            return True
-        except ImportError:
-            return False
+        return _module_available("camelot")
 
     def extract(self, path: Path, pages: Optional[str] = None) -> List[ExtractedTable]:
         if not self.is_available():
@@ -146,28 +256,41 @@ class CamelotTableExtractor(TableExtractor):
         if path.suffix.lower() != ".pdf":
             raise ValueError(f"Camelot only supports PDF files, got: {path.suffix}")
 
-        import camelot
         pages = pages or "all"
-        kwargs: Dict[str, Any] = {"flavor": self.flavor, "pages": pages}
+        kwargs: Dict[str, Any] = {"flavor": self.flavor}
         if self.flavor == "lattice":
             kwargs["line_scale"] = self.line_scale
         else:
             kwargs["row_tol"] = self.row_tol
 
-        tables = camelot.read_pdf(str(path), **kwargs)
-        extracted: List[ExtractedTable] = []
-        for idx, table in enumerate(tables):
-            data = table.df.values.tolist()
-            bbox = table._bbox if hasattr(table, "_bbox") else None
-            extracted.append(ExtractedTable(
-                data=data,
-                page_number=table.page,
-                table_index=idx,
-                bbox=bbox,
-                accuracy=table.accuracy if hasattr(table, "accuracy") else 0.0,
-                extraction_method=f"camelot_{self.flavor}",
-                metadata={"flavor": self.flavor, "shape": table.shape},
-            ))
+        if self.n_workers > 1:
+            # Counting pages opens the whole PDF; only "all"/"end" need it
+            total_pages = self._count_pages(path) if _spec_needs_page_count(pages) else None
+            page_numbers = _parse_pages(pages, total_pages)
+            if len(page_numbers) > 1:
+                return self._extract_parallel(path, page_numbers, kwargs)
+        return _read_camelot_pages(str(path), pages, kwargs)
+
+    def _count_pages(self, path: Path) -> int:
+        from pypdf import PdfReader
+        return len(PdfReader(str(path)).pages)
+
+    def _extract_parallel(
+        self, path: Path, page_numbers: List[int], kwargs: Dict[str, Any]
+    ) -> List[ExtractedTable]:
+        # One contiguous block of pages per worker, so each process pays
+        # the Ghostscript start-up once and only decodes its own slice
+        blocks = _page_blocks(page_numbers, self.n_workers)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(blocks), mp_context=context) as pool:
+            futures = [
+                pool.submit(_read_camelot_pages, str(path), block, kwargs)
+                for block in blocks
+            ]
+            # Gather in submission order so tables keep reading order
+            extracted = [table for future in futures for table in future.result()]
+        for idx, table in enumerate(extracted):
+            table.table_index = idx
         return extracted
 
 
@@ -180,11 +303,7 @@ class TabulaTableExtractor(TableExtractor):
         self.guess = guess
 
     def is_available(self) -> bool:
-        try:
-            import tabula
-            return True
-        except ImportError:
-            return False
+        return _module_available("tabula")
 
     def extract(self, path: Path, pages: Optional[str] = None) -> List[ExtractedTable]:
         if not self.is_available():
@@ -325,22 +444,14 @@ class MarkdownTableConverter(TableToTextConverter):
             return ""
         data = table.data
         num_cols = table.num_cols
-        col_widths = [max(3, max(len(str(row[i])) if i < len(row) else 0 for row in data)) for i in range(num_cols)]
+        # Pad ragged rows once; widths then come from a column-wise max
+        rows = [list(map(str, row)) + [""] * (num_cols - len(row)) for row in data]
+        col_widths = [max(3, max(map(len, col))) for col in zip(*rows)]
+        fmt = "| " + " | ".join(f"{{:<{w}}}" for w in col_widths) + " |"
 
-        lines: List[str] = []
+        lines = [fmt.format(*row) for row in rows]
         if self.include_header_row and data:
-            header = data[0]
-            header_cells = [str(header[i] if i < len(header) else "").ljust(col_widths[i]) for i in range(num_cols)]
-            lines.append("| " + " | ".join(header_cells) + " |")
-            sep = ["-" * w for w in col_widths]
-            lines.append("| " + " | ".join(sep) + " |")
-            for row in data[1:]:
-                cells = [str(row[i] if i < len(row) else "").ljust(col_widths[i]) for i in range(num_cols)]
-                lines.append("| " + " | ".join(cells) + " |")
-        else:
-            for row in data:
-                cells = [str(row[i] if i < len(row) else "").ljust(col_widths[i]) for i in range(num_cols)]
-                lines.append("| " + " | ".join(cells) + " |")
+            lines.insert(1, "| " + " | ".join("-" * w for w in col_widths) + " |")
         return "\n".join(lines)
 
 
@@ -358,6 +469,16 @@ class CSVTableConverter(TableToTextConverter):
     def convert(self, table: ExtractedTable) -> str:
         if table.is_empty:
             return ""
+        if len(self.delimiter) == 1 and len(self.quote_char) == 1:
+            # The C csv writer handles the quoting; it only takes
+            # single-character delimiters and quote characters
+            buf = io.StringIO()
+            writer = csv.writer(
+                buf, delimiter=self.delimiter, quotechar=self.quote_char, lineterminator="\n"
+            )
+            # csv writes a lone empty field as '""'; keep it a blank line
+            writer.writerows([] if row == [""] else map(str, row) for row in table.data)
+            return buf.getvalue()[:-1]
         lines = []
         for row in table.data:
             cells = [self._quote_cell(str(cell)) for cell in row]
@@ -388,13 +509,14 @@ class PlainTextTableConverter(TableToTextConverter):
         data = table.data
         if self.pad_columns:
             num_cols = table.num_cols
-            col_widths = [max(len(str(row[i])) if i < len(row) else 0 for row in data) for i in range(num_cols)]
-            lines = []
-            for row in data:
-                cells = [str(row[i] if i < len(row) else "").ljust(col_widths[i]) for i in range(num_cols)]
-                lines.append(self.column_separator.join(cells))
-            return "\n".join(lines)
-        return "\n".join(self.column_separator.join(str(c) for c in row) for row in data)
+            # Pad ragged rows once so no cell needs a bounds check
+            rows = [list(map(str, row)) + [""] * (num_cols - len(row)) for row in data]
+            col_widths = [max(map(len, col)) for col in zip(*rows)]
+            fmt = self.column_separator.replace("{", "{{").replace("}", "}}").join(
+                f"{{:<{w}}}" for w in col_widths
+            )
+            return "\n".join([fmt.format(*row) for row in rows])
+        return "\n".join(self.column_separator.join(map(str, row)) for row in data)
 
 
 class HTMLTableConverter(TableToTextConverter):
@@ -437,6 +559,21 @@ class HTMLTableConverter(TableToTextConverter):
         return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
+def _dumps_json(obj: Any, indent: Optional[int]) -> str:
+    """json.dumps(obj, indent=indent, ensure_ascii=False), in C via orjson when possible.
+
+    orjson only pretty-prints with a two-space indent (its compact form has
+    no spaces after separators), so other indents use the json module.
+    """
+    if indent == 2 and orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates, which json escapes but orjson rejects
+            pass
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+
 class JSONTableConverter(TableToTextConverter):
     """Convert tables to JSON format."""
 
@@ -449,7 +586,6 @@ class JSONTableConverter(TableToTextConverter):
         return "json"
 
     def convert(self, table: ExtractedTable) -> str:
-        import json
         if table.is_empty:
             return "[]"
         data = table.data
@@ -457,10 +593,13 @@ class JSONTableConverter(TableToTextConverter):
             headers = [str(h) for h in data[0]]
             rows = []
             for row in data[1:]:
-                row_dict = {headers[i] if i < len(headers) else f"col_{i}": str(cell) for i, cell in enumerate(row)}
+                row_dict = {
+                    (headers[i] if i < len(headers) else f"col_{i}"): str(cell)
+                    for i, cell in enumerate(row)
+                }
                 rows.append(row_dict)
-            return json.dumps(rows, indent=self.indent, ensure_ascii=False)
-        return json.dumps(data, indent=self.indent, ensure_ascii=False)
+            return _dumps_json(rows, self.indent)
+        return _dumps_json(data, self.indent)
 
 
 def get_converter(format: TableToTextFormat) -> TableToTextConverter:
@@ -510,10 +649,12 @@ class StructuredTableData:
         )
 
     def select_columns(self, columns: List[str]) -> "StructuredTableData":
-        new_rows = [{k: v for k, v in row.items() if k in columns} for row in self.rows]
-        new_types = {k: v for k, v in self.column_types.items() if k in columns}
+        # Set membership keeps this O(rows * cols) rather than O(rows * cols * selected)
+        wanted = set(columns)
+        new_rows = [{k: v for k, v in row.items() if k in wanted} for row in self.rows]
+        new_types = {k: v for k, v in self.column_types.items() if k in wanted}
         return StructuredTableData(
-            headers=[h for h in self.headers if h in columns],
+            headers=[h for h in self.headers if h in wanted],
             rows=new_rows, column_types=new_types, source_table=self.source_table
         )
 
@@ -532,6 +673,14 @@ class StructuredTableData:
         return cls(headers=data["headers"], rows=data["rows"], column_types=data["column_types"])
 
 
+_BOOL_VALUES = frozenset({"true", "false", "yes", "no", "1", "0"})
+_BOOL_TRUE = frozenset({"true", "yes", "1"})
+
+# Header normalization: drop punctuation, then snake_case the whitespace
+_HEADER_PUNCT_RE = re.compile(r"[^\w\s]")
+_HEADER_SPACE_RE = re.compile(r"\s+")
+
+
 class TableDataHandler:
     """Handler for structured table data operations."""
 
@@ -560,10 +709,13 @@ class TableDataHandler:
 
         column_types: Dict[str, str] = {}
         if self.infer_types:
+            # Numbers parsed while inferring are reused by the conversion
+            parsed: Dict[str, Dict[str, Any]] = {}
             for header in headers:
                 values = [row.get(header, "") for row in rows]
-                column_types[header] = self._infer_column_type(values)
-            rows = self._convert_values(rows, column_types)
+                parsed[header] = {}
+                column_types[header] = self._infer_column_type(values, parsed[header])
+            rows = self._convert_values(rows, column_types, parsed)
         else:
             column_types = {h: "string" for h in headers}
 
@@ -571,8 +723,8 @@ class TableDataHandler:
 
     def _normalize_header(self, header: str) -> str:
         header = header.strip()
-        header = re.sub(r"[^\w\s]", "", header)
-        header = re.sub(r"\s+", "_", header).lower()
+        header = _HEADER_PUNCT_RE.sub("", header)
+        header = _HEADER_SPACE_RE.sub("_", header).lower()
         if header and not header[0].isalpha() and header[0] != "_":
             header = "_" + header
         return header or "column"
@@ -589,56 +741,68 @@ class TableDataHandler:
                 unique.append(h)
         return unique
 
-    def _infer_column_type(self, values: List[str]) -> str:
+    def _infer_column_type(self, values: List[str], parsed: Optional[Dict[str, Any]] = None) -> str:
+        """Infer a column's type; numeric parses are left in parsed (value -> number)."""
         non_empty = [v for v in values if v.strip()]
         if not non_empty:
             return "string"
+        if parsed is None:
+            parsed = {}
         # Check integer
-        if all(self._is_int(v) for v in non_empty):
+        if self._parse_all(non_empty, int, parsed):
             return "integer"
+        parsed.clear()
         # Check float
-        if all(self._is_float(v) for v in non_empty):
+        if self._parse_all(non_empty, float, parsed):
             return "float"
+        parsed.clear()
         # Check boolean
-        bool_vals = {"true", "false", "yes", "no", "1", "0"}
-        if all(v.lower() in bool_vals for v in non_empty):
+        if all(v.lower() in _BOOL_VALUES for v in non_empty):
             return "boolean"
         return "string"
 
-    def _is_int(self, v: str) -> bool:
-        try:
-            int(v.replace(",", "").replace(" ", ""))
-            return True
-        except ValueError:
-            return False
-
-    def _is_float(self, v: str) -> bool:
-        try:
-            float(v.replace(",", "").replace(" ", ""))
-            return True
-        except ValueError:
-            return False
+    @staticmethod
+    def _parse_all(values: List[str], kind: Any, parsed: Dict[str, Any]) -> bool:
+        """Parse every value as kind, once per distinct value; stop at the first failure."""
+        for v in values:
+            if v in parsed:
+                continue
+            try:
+                parsed[v] = kind(v.replace(",", "").replace(" ", ""))
+            except ValueError:
+                return False
+        return True
 
-    def _convert_values(self, rows: List[Dict[str, Any]], column_types: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _convert_values(
+        self,
+        rows: List[Dict[str, Any]],
+        column_types: Dict[str, str],
+        parsed: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        parsed = parsed or {}
         converted = []
         for row in rows:
             new_row = {}
             for key, value in row.items():
                 col_type = column_types.get(key, "string")
-                new_row[key] = self._convert_value(value, col_type)
+                new_row[key] = self._convert_value(value, col_type, parsed.get(key))
             converted.append(new_row)
         return converted
 
-    def _convert_value(self, value: str, col_type: str) -> Any:
+    def _convert_value(
+        self, value: str, col_type: str, parsed: Optional[Dict[str, Any]] = None
+    ) -> Any:
         if not value.strip():
             return None
+        if parsed and value in parsed:
+            return parsed[value]
         try:
             if col_type == "integer":
                 return int(value.replace(",", "").replace(" ", ""))
             elif col_type == "float":
                 return float(value.replace(",", "").replace(" ", ""))
             elif col_type == "boolean":
-                return value.lower() in {"true", "yes", "1"}
+                return value.lower() in _BOOL_TRUE
         except (ValueError, TypeError):
             pass
         return value
@@ -648,6 +812,10 @@ class TableDataHandler:
 class TableCollection:
     """Collection of extracted tables from a document."""
 
+    # Below this many tables, to_structured() stays serial; pool start-up
+    # and pickling would cost more than the parallel type inference saves
+    PARALLEL_THRESHOLD = 4
+
     def __init__(self, tables: Optional[List[ExtractedTable]] = None, source_path: Optional[Path] = None):
         self.tables = tables or []
         self.source_path = source_path
@@ -673,8 +841,18 @@ class TableCollection:
     def filter_by_size(self, min_rows: int = 0, min_cols: int = 0) -> List[ExtractedTable]:
         return [t for t in self.tables if t.num_rows >= min_rows and t.num_cols >= min_cols]
 
-    def to_structured(self, handler: Optional[TableDataHandler] = None) -> List[StructuredTableData]:
+    def to_structured(
+        self, handler: Optional[TableDataHandler] = None, n_workers: int = 1
+    ) -> List[StructuredTableData]:
         handler = handler or TableDataHandler()
+        if n_workers > 1 and len(self.tables) >= self.PARALLEL_THRESHOLD:
+            chunksize = max(1, len(self.tables) // (n_workers * 4))
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                results = list(pool.map(handler.process, self.tables, chunksize=chunksize))
+            # Workers see pickled copies; point back at the caller's tables
+            for result, table in zip(results, self.tables):
+                result.source_table = table
+            return results
         return [handler.process(t) for t in self.tables]
 
     def to_text(self, format: TableToTextFormat = TableToTextFormat.MARKDOWN, separator: str = "\n\n") -> str:
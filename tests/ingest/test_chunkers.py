@@ -91,6 +91,15 @@ class TestChunkMetadata:
         assert result["source"] == "test.txt"
         assert result["chunk_index"] == 1
         assert result["total_chunks"] == 5
+    
+    def test_metadata_strings_are_interned(self) -> None:
+        """Test that equal source and section strings share one object."""
+        source = "".join(["docs/", "guide.md"])
+        section = "".join(["Intro", "duction"])
+        first = ChunkMetadata(source=source, section=section)
+        second = ChunkMetadata(source="docs/guide.md", section="Introduction")
+        assert first.source is second.source
+        assert first.section is second.section
 
 
 class TestChunk:
@@ -145,6 +154,23 @@ class TestChunk:
         assert chunk.content == "Test content"
         assert chunk.id == "chunk_1"
         assert chunk.metadata.chunk_index == 1
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_chunk_json_round_trip(self, monkeypatch, use_orjson: bool) -> None:
+        """Test JSON round trip with orjson and with the stdlib fallback."""
+        import sys
+        
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        metadata = ChunkMetadata(source="test.txt", chunk_index=2, extra={"tags": ["a"]})
+        chunk = Chunk(content="Test \u00e9", metadata=metadata, id="chunk_1")
+        
+        data = chunk.to_json()
+        
+        assert isinstance(data, bytes)
+        assert Chunk.from_json(data) == chunk
 
 
 class TestChunkingStrategyValidation:
@@ -168,6 +194,42 @@ class TestChunkingStrategyValidation:
         
         with pytest.raises(ValueError, match="chunk_overlap must be less than chunk_size"):
             FixedSizeChunker(chunk_size=100, chunk_overlap=150)
+    
+    def test_chunk_text_matches_chunk(self, sample_document: Document) -> None:
+        """Test that chunk_text on raw text matches chunk on a document."""
+        metadata = DocumentMetadata(source="paged.txt", page_number=3)
+        doc = Document(content=sample_document.content, metadata=metadata)
+        
+        chunkers = (
+            FixedSizeChunker(chunk_size=80, chunk_overlap=10),
+            RecursiveChunker(chunk_size=80, chunk_overlap=10),
+        )
+        for chunker in chunkers:
+            from_doc = chunker.chunk(doc)
+            from_text = chunker.chunk_text(doc.content, "paged.txt", page_number=3)
+            assert [c.content for c in from_text] == [c.content for c in from_doc]
+            starts = [c.metadata.start_char for c in from_doc]
+            assert [c.metadata.start_char for c in from_text] == starts
+            assert all(c.metadata.page_number == 3 for c in from_text)
+    
+    def test_default_chunk_text_wraps_chunk(self) -> None:
+        """Test that a strategy implementing only chunk() still supports chunk_text."""
+        class WholeDocumentChunker(ChunkingStrategy):
+            def chunk(self, document: Document) -> list:
+                return [self._create_chunk(
+                    content=document.content,
+                    source=document.metadata.source,
+                    chunk_index=0,
+                    start_char=0,
+                    end_char=len(document.content),
+                    page_number=document.metadata.page_number,
+                )]
+        
+        chunker = WholeDocumentChunker(chunk_size=100, chunk_overlap=0)
+        chunks = chunker.chunk_text("Body", "s.txt", page_number=2)
+        assert chunks[0].content == "Body"
+        assert chunks[0].metadata.source == "s.txt"
+        assert chunks[0].metadata.page_number == 2
 
 
 class TestFixedSizeChunker:
@@ -52,7 +52,20 @@ class TestDocumentMetadata:
         assert data["source"] == "/path/to/file.txt"
         assert data["title"] == "Test"
         assert data["file_type"] == "txt"
-
+    
+    def test_metadata_to_dict_dates_follow_reassignment(self):
+        """Test that cached date strings are refreshed when a date changes."""
+        from datetime import datetime
+        
+        metadata = DocumentMetadata(source="a.txt", created_date=datetime(2025, 1, 15))
+        assert metadata.to_dict()["created_date"] == "2025-01-15T00:00:00"
+        assert metadata.to_dict()["created_date"] == "2025-01-15T00:00:00"
+        
+        metadata.created_date = datetime(2025, 2, 1, 8, 30)
+        assert metadata.to_dict()["created_date"] == "2025-02-01T08:30:00"
+        assert "_created_iso" not in metadata.to_dict()
+        expected = DocumentMetadata(source="a.txt", created_date=datetime(2025, 2, 1, 8, 30))
+        assert metadata == expected
 
 
 class TestDocument:
@@ -85,6 +98,67 @@ class TestDocument:
         with pytest.raises(ValueError):
             Document(content=None, metadata=metadata)  # type: ignore
     
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_document_json_round_trip(self, monkeypatch, use_orjson):
+        """Test JSON round trip with orjson and with the stdlib fallback."""
+        from datetime import datetime
+        from src.ingest import models
+        
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(models, "orjson", None)
+        metadata = DocumentMetadata(
+            source="test.txt",
+            title="Test",
+            created_date=datetime(2025, 1, 15, 10, 30, 0, 500),
+        )
+        doc = Document(content="Content", metadata=metadata)
+        
+        assert Document.from_json(doc.to_json()) == doc
+    
+    def test_document_json_layout_without_orjson(self, monkeypatch):
+        """Test the stdlib fallback writes the same bytes as orjson, unset dates included."""
+        pytest.importorskip("orjson")
+        from src.ingest import models
+        
+        doc = Document(content="Café", metadata=DocumentMetadata(source="test.txt"))
+        with_orjson = doc.to_json()
+        monkeypatch.setattr(models, "orjson", None)
+        
+        assert doc.to_json() == with_orjson
+        assert b"created_date" not in with_orjson
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_document_json_accepts_same_extra_values(self, monkeypatch, use_orjson):
+        """Test both JSON paths encode non-str keys and reject datetimes in extra alike."""
+        import json
+        from datetime import datetime
+        from src.ingest import models
+        
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(models, "orjson", None)
+        metadata = DocumentMetadata(source="test.txt", extra={1: "x", "big": 2 ** 70})
+        doc = Document(content="Content", metadata=metadata)
+        
+        data = json.loads(doc.to_json())
+        assert data["metadata"]["extra"] == {"1": "x", "big": 2 ** 70}
+        
+        doc.metadata.extra = {"when": datetime(2025, 1, 1)}
+        with pytest.raises(TypeError):
+            doc.to_json()
+    
+    def test_document_has_no_instance_dict(self):
+        """Test that documents use slots instead of a per-instance dict."""
+        metadata = DocumentMetadata(source="test.txt")
+        doc = Document(content="Content", metadata=metadata)
+        assert not hasattr(doc, "__dict__")
+        assert not hasattr(metadata, "__dict__")
+        with pytest.raises(AttributeError):
+            doc.score = 1.0  # type: ignore[attr-defined]
+    
     def test_document_to_dict(self):
         """Test serializing document to dictionary."""
         metadata = DocumentMetadata(source="test.txt", title="Test")
@@ -163,6 +237,38 @@ This is the body.
         finally:
             os.unlink(temp_path)
     
+    def test_parse_date(self):
+        """Test parsing ISO and fallback date formats."""
+        from datetime import datetime
+        
+        loader = MarkdownLoader()
+        assert loader._parse_date("2025-01-15") == datetime(2025, 1, 15)
+        assert loader._parse_date("2025-01-15T10:30:00") == datetime(2025, 1, 15, 10, 30)
+        assert loader._parse_date("January 15, 2025") == datetime(2025, 1, 15)
+        assert loader._parse_date("not a date") is None
+        assert loader._parse_date(42) is None
+    
+    @pytest.mark.parametrize("threshold", [1 << 20, 0])
+    def test_load_crlf_markdown(self, monkeypatch, threshold):
+        """Test that CRLF files load the same with and without mmap."""
+        import src.ingest.loaders as loaders_module
+        
+        monkeypatch.setattr(loaders_module, "_MMAP_THRESHOLD", threshold)
+        loader = MarkdownLoader()
+        
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".md", delete=False
+        ) as f:
+            f.write(b"---\r\ntitle: CRLF\r\n---\r\n# Body\r\n\r\nText \xff\r\n")
+            temp_path = f.name
+        
+        try:
+            docs = loader.load(Path(temp_path))
+            assert docs[0].metadata.title == "CRLF"
+            assert docs[0].content == "# Body\n\nText"
+        finally:
+            os.unlink(temp_path)
+    
     def test_file_not_found(self):
         """Test that FileNotFoundError is raised for missing files."""
         loader = MarkdownLoader()
@@ -250,6 +356,31 @@ class TestHTMLLoader:
             assert "Content" in docs[0].content
         finally:
             os.unlink(temp_path)
+    
+    def test_html_preserve_links(self):
+        """Test that links are converted to markdown format."""
+        loader = HTMLLoader(preserve_links=True)
+        
+        html_content = """<html>
+<body><p>See <a href="https://example.com">the <b>docs</b></a> and
+<a href="">no target</a>.</p></body>
+</html>"""
+        
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".html", delete=False, encoding="utf-8"
+        ) as f:
+            f.write(html_content)
+            temp_path = f.name
+        
+        try:
+            pytest.importorskip("bs4")
+            
+            docs = loader.load(Path(temp_path))
+            assert "[thedocs](https://example.com)" in docs[0].content
+            assert "no target" in docs[0].content
+            assert "[no target]" not in docs[0].content
+        finally:
+            os.unlink(temp_path)
 
 
 class TestPDFLoader:
@@ -271,6 +402,19 @@ class TestPDFLoader:
         loader = PDFLoader()
         with pytest.raises(FileNotFoundError):
             loader.load(Path("/nonexistent/file.pdf"))
+    
+    def test_extract_chars_text_groups_lines(self):
+        """Test fast character-based extraction orders text by line."""
+        from types import SimpleNamespace
+        
+        chars = [
+            {"text": "b", "top": 100.5, "x0": 10},
+            {"text": "a", "top": 100.0, "x0": 0},
+            {"text": "d", "top": 120.0, "x0": 0},
+            {"text": "c", "top": 100.0, "x0": 20},
+        ]
+        page = SimpleNamespace(chars=chars)
+        assert PDFLoader._extract_chars_text(page) == "abc\nd"
 
 
 class TestDOCXLoader:
@@ -293,3 +437,16 @@ class TestDOCXLoader:
         loader = DOCXLoader()
         with pytest.raises(FileNotFoundError):
             loader.load(Path("/nonexistent/file.docx"))
+    
+    def test_render_paragraph_heading_markers(self):
+        """Test that heading styles are rendered with Markdown markers."""
+        from types import SimpleNamespace
+        
+        loader = DOCXLoader()
+        
+        def para(style_name):
+            return SimpleNamespace(style=SimpleNamespace(name=style_name))
+        
+        assert loader._render_paragraph(para("Heading 2"), "Intro") == "## Intro"
+        assert loader._render_paragraph(para("Heading"), "Intro") == "# Intro"
+        assert loader._render_paragraph(para("Normal"), "Body") == "Body"
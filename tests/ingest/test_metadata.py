@@ -6,10 +6,12 @@ for document processing.
 
 import pytest
 from pathlib import Path
+import os
 from datetime import datetime
 
 from src.ingest.models import Document, DocumentMetadata, Chunk, ChunkMetadata
 from src.ingest.metadata import (
+    MetadataExtractor,
     SourceExtractor,
     SourceInfo,
     PageExtractor,
@@ -55,6 +57,36 @@ class TestSourceExtractor:
         
         assert result == {}
     
+    def test_extract_from_path_caches_stats(self, tmp_path):
+        """Test that file stats are cached until clear_cache is called."""
+        source = tmp_path / "doc.txt"
+        source.write_text("abc")
+        extractor = SourceExtractor(include_timestamps=False)
+        
+        assert extractor.extract_from_path(str(source)).file_size == 3
+        source.write_text("abcdef")
+        assert extractor.extract_from_path(str(source)).file_size == 3
+        
+        extractor.clear_cache()
+        assert extractor.extract_from_path(str(source)).file_size == 6
+    
+    def test_extract_many(self, tmp_path):
+        """Test batch extraction keeps input order and handles missing files."""
+        paths = []
+        for i in range(3):
+            source = tmp_path / f"doc{i}.txt"
+            source.write_text("x" * (i + 1))
+            paths.append(str(source))
+        paths.append(str(tmp_path / "missing.txt"))
+        
+        extractor = SourceExtractor(include_timestamps=False)
+        infos = extractor.extract_many(paths)
+        
+        assert [info.filename for info in infos] == [
+            "doc0.txt", "doc1.txt", "doc2.txt", "missing.txt",
+        ]
+        assert [info.file_size for info in infos] == [1, 2, 3, None]
+    
     def test_source_info_to_dict(self):
         """Test SourceInfo serialization."""
         info = SourceInfo(
@@ -69,6 +101,21 @@ class TestSourceExtractor:
         assert d["path"] == "/path/to/file.pdf"
         assert d["filename"] == "file.pdf"
         assert d["file_size"] == 1024
+        assert d["created_time"] is None
+        assert d["modified_time"] is None
+    
+    def test_source_info_timestamps_serialized_as_iso(self, tmp_path):
+        """Test that epoch timestamps are formatted only in to_dict."""
+        source = tmp_path / "doc.txt"
+        source.write_text("abc")
+        os.utime(source, (0, 1700000000.5))
+        
+        info = SourceExtractor().extract_from_path(str(source))
+        
+        assert info.modified_time == 1700000000.5
+        assert info.to_dict()["modified_time"] == (
+            datetime.fromtimestamp(1700000000.5).isoformat()
+        )
 
 
 class TestPageExtractor:
@@ -164,6 +211,16 @@ class TestSectionExtractor:
         assert info.section_title == "Welcome"
         assert info.section_level == 1
     
+    def test_extract_earliest_heading_of_any_syntax(self):
+        """Test that the first heading in the content wins regardless of syntax."""
+        extractor = SectionExtractor()
+        content = "Overview\n========\n\nText.\n\n# Later Heading\n"
+        
+        info = extractor.extract_section_from_content(content)
+        
+        assert info.section_title == "Overview"
+        assert info.section_level == 1
+    
     def test_extract_all_sections(self):
         """Test extraction of all sections with hierarchy."""
         extractor = SectionExtractor(use_hierarchy=True)
@@ -233,6 +290,27 @@ class TestTitleExtractor:
         assert result["title_info"]["title_source"] == "first_heading"
         assert result["title_info"]["confidence"] == "medium"
     
+    def test_h1_prefers_atx_over_setext_over_html(self):
+        """Test that the H1 strategy keeps its syntax precedence, not document order."""
+        extractor = TitleExtractor()
+        
+        assert extractor.extract_title("<h1>Html</h1>\n# Title").title == "Title"
+        assert extractor.extract_title("<h1>Html</h1>\n\nSetext\n===").title == "Setext"
+        assert extractor.extract_title("Setext\n===\n\n# Atx").title == "Atx"
+        
+        pipeline = MetadataEnrichmentPipeline(extractors=[extractor])
+        result = pipeline._run_extractors("<h1>Html</h1>\n# Title", {})
+        assert result["title_info"]["title"] == "Title"
+    
+    def test_setext_h2_is_not_a_first_heading(self):
+        """Test that a paragraph followed by a rule is not taken as the title."""
+        extractor = TitleExtractor()
+        
+        result = extractor.extract("para\n---\n\nMore text.", {"source": "notes.md"})
+        
+        assert result["title_info"]["title"] == "Notes"
+        assert result["title_info"]["title_source"] == "filename"
+    
     def test_extract_from_filename(self):
         """Test title extraction from filename."""
         extractor = TitleExtractor(fallback_to_filename=True, clean_filename=True)
@@ -243,6 +321,9 @@ class TestTitleExtractor:
         assert result["title_info"]["title"] == "My Document File"
         assert result["title_info"]["title_source"] == "filename"
         assert result["title_info"]["confidence"] == "low"
+        
+        result = extractor.extract(content, {"source": "/docs/ my--notes _ v2 .md"})
+        assert result["title_info"]["title"] == "My Notes V2"
     
     def test_no_title_found(self):
         """Test when no title can be extracted."""
@@ -280,6 +361,36 @@ class TestHeadingExtractor:
         assert headings[1]["text"] == "Section 1"
         assert headings[1]["level"] == 2
     
+    def test_short_content(self):
+        """Test that content too short for any heading yields no headings."""
+        extractor = HeadingExtractor()
+        
+        for content in ["", "#", "# ", "<h", b"# "]:
+            assert extractor.extract(content, {}) == {"headings": [], "heading_count": 0}
+        assert extractor.extract("# x", {})["heading_count"] == 1
+    
+    def test_extract_headings_from_bytes(self):
+        """Test that UTF-8 bytes yield the same headings as text."""
+        extractor = HeadingExtractor()
+        content = "# Café\n\nIntro\n\n<h2>Naïve <i>x</i></h2>\n\nSetup\n-----\n"
+        
+        from_text = extractor.extract_headings(content)
+        from_bytes = extractor.extract_headings(content.encode("utf-8"))
+        
+        assert [(h.level, h.text, h.line_number) for h in from_bytes] == [
+            (h.level, h.text, h.line_number) for h in from_text
+        ]
+        assert from_bytes[1].position == content.encode("utf-8").index(b"<h2>")
+    
+    def test_unclosed_html_headings(self):
+        """Test that unclosed HTML heading tags do not swallow later headings."""
+        extractor = HeadingExtractor()
+        content = "<h2>broken " * 5000 + "\n<h3>Real</h3>\n<h1 class='x'>A <b>B</b></h1>"
+        
+        headings = extractor.extract_headings(content)
+        
+        assert [(h.level, h.text) for h in headings] == [(3, "Real"), (1, "A B")]
+    
     def test_filter_by_level(self):
         """Test filtering headings by level."""
         extractor = HeadingExtractor(min_level=2, max_level=3)
@@ -299,6 +410,15 @@ class TestHeadingExtractor:
         headings = result["headings"]
         assert all(2 <= h["level"] <= 3 for h in headings)
     
+    def test_filter_by_level_mixed_syntaxes(self):
+        """Test that excluded levels are not picked up as other syntaxes."""
+        extractor = HeadingExtractor(min_level=2, max_level=2)
+        content = "# Title\n---\n\n<h3>Deep</h3>\n---\n\nSub\n---\n\n<h2>Html</h2>"
+        
+        headings = extractor.extract_headings(content)
+        
+        assert [(h.text, h.level) for h in headings] == [("Sub", 2), ("Html", 2)]
+    
     def test_line_numbers(self):
         """Test line number extraction."""
         extractor = HeadingExtractor(include_line_numbers=True)
@@ -309,6 +429,41 @@ class TestHeadingExtractor:
         assert result["heading_count"] == 1
         assert result["headings"][0]["line_number"] is not None
     
+    def test_mixed_heading_syntaxes_in_order(self):
+        """Test that ATX, Setext and HTML headings come back in document order."""
+        extractor = HeadingExtractor()
+        content = """<h2>Intro <em>here</em></h2>
+
+Overview
+========
+
+# Details
+
+Notes
+-----
+"""
+        
+        headings = extractor.extract_headings(content)
+        
+        assert [(h.text, h.level) for h in headings] == [
+            ("Intro here", 2),
+            ("Overview", 1),
+            ("Details", 1),
+            ("Notes", 2),
+        ]
+        assert [h.line_number for h in headings] == [1, 3, 6, 8]
+    
+    def test_iter_headings_is_lazy(self):
+        """Test that iter_headings yields the same headings one at a time."""
+        extractor = HeadingExtractor()
+        content = "# One\n\n## Two\n\n### Three\n"
+        
+        iterator = extractor.iter_headings(content)
+        first = next(iterator)
+        
+        assert first.text == "One"
+        assert [first] + list(iterator) == extractor.extract_headings(content)
+    
     def test_table_of_contents(self):
         """Test table of contents generation."""
         extractor = HeadingExtractor()
@@ -388,6 +543,325 @@ class TestMetadataEnrichmentPipeline:
         assert enriched[0].metadata.title == "Doc 1"
         assert enriched[1].metadata.title == "Doc 2"
     
+    def test_n_workers_enrich_chunks_matches_serial(self):
+        """Test that process-pool chunk enrichment matches serial enrichment."""
+        extractors = [SectionExtractor(), HeadingExtractor()]
+        pipeline = MetadataEnrichmentPipeline(extractors=extractors, n_workers=2)
+        chunks = [
+            Chunk(
+                content=f"## Section {i}\n\nBody {i}.",
+                metadata=ChunkMetadata(source="test.md", chunk_index=i),
+            )
+            for i in range(pipeline.PARALLEL_THRESHOLD + 6)
+        ]
+        
+        with pipeline:
+            parallel = pipeline.enrich_chunks(chunks)
+        serial = MetadataEnrichmentPipeline(extractors=extractors).enrich_chunks(chunks)
+        
+        assert [c.to_dict() for c in parallel] == [c.to_dict() for c in serial]
+        assert parallel[3].metadata.section == "Section 3"
+    
+    def test_n_workers_enrich_documents_matches_serial(self):
+        """Test that process-pool document enrichment matches serial enrichment."""
+        extractors = [SectionExtractor(), TitleExtractor()]
+        documents = [
+            Document(
+                content=f"# Doc {i}\n\nBody {i}.",
+                metadata=DocumentMetadata(source=f"doc{i}.md"),
+            )
+            for i in range(MetadataEnrichmentPipeline.PARALLEL_THRESHOLD + 2)
+        ]
+        pipeline = MetadataEnrichmentPipeline(extractors=extractors, n_workers=2)
+        
+        with pipeline:
+            parallel = pipeline.enrich_documents(documents)
+        serial = MetadataEnrichmentPipeline(extractors=extractors).enrich_documents(documents)
+        
+        assert [d.to_dict() for d in parallel] == [d.to_dict() for d in serial]
+        assert parallel[5].metadata.title == "Doc 5"
+    
+    def test_pool_restarts_after_settings_change(self):
+        """Test that pooled enrichment follows later merge strategy and extractor changes."""
+        extractor = HeadingExtractor()
+        pipeline = MetadataEnrichmentPipeline(extractors=[extractor], n_workers=2)
+        chunks = [
+            Chunk(
+                content="# Title\n\n## Part",
+                metadata=ChunkMetadata(source="a.md", chunk_index=i),
+            )
+            for i in range(pipeline.PARALLEL_THRESHOLD)
+        ]
+        
+        with pipeline:
+            assert pipeline.enrich_chunks(chunks)[0].metadata.extra["heading_count"] == 2
+            extractor.min_level = 2
+            pipeline.merge_strategy = "first"
+            parallel = pipeline.enrich_chunks(chunks)
+        serial = MetadataEnrichmentPipeline(
+            extractors=[extractor], merge_strategy="first"
+        ).enrich_chunks(chunks)
+        
+        assert parallel[0].metadata.extra["heading_count"] == 1
+        assert [c.to_dict() for c in parallel] == [c.to_dict() for c in serial]
+    
+    def test_pool_is_shut_down_on_exit_and_collection(self):
+        """Test that the worker pool stops with the with block or the pipeline."""
+        import gc
+        
+        with MetadataEnrichmentPipeline(n_workers=2) as pipeline:
+            pool = pipeline._get_pool(2)
+        assert pipeline._pool is None
+        assert pool._shutdown_thread
+        
+        pipeline = MetadataEnrichmentPipeline(n_workers=2)
+        pool = pipeline._get_pool(2)
+        del pipeline
+        gc.collect()
+        assert pool._shutdown_thread
+    
+    def test_enrich_chunks_passes_document_context(self):
+        """Test that each chunk's extractors see the parent document fields."""
+        class DocTitleExtractor(MetadataExtractor):
+            def extract(self, content, existing_metadata=None):
+                return {"seen_doc_title": existing_metadata.get("doc_title")}
+        
+        document = Document(
+            content="Body",
+            metadata=DocumentMetadata(source="guide.md", title="Guide", total_pages=3),
+        )
+        chunks = [
+            Chunk(content=f"Part {i}", metadata=ChunkMetadata(source="guide.md"))
+            for i in range(3)
+        ]
+        pipeline = MetadataEnrichmentPipeline(extractors=[DocTitleExtractor()])
+        
+        enriched = pipeline.enrich_chunks(chunks, document)
+        
+        assert [c.metadata.extra["seen_doc_title"] for c in enriched] == ["Guide"] * 3
+        assert pipeline.enrich_chunk(chunks[0], document).to_dict() == enriched[0].to_dict()
+    
+    def test_iter_enrich_chunks_is_lazy(self):
+        """Test that streaming enrichment consumes its input on demand."""
+        pipeline = MetadataEnrichmentPipeline(extractors=[SectionExtractor()])
+        consumed = []
+        
+        def source():
+            for i in range(3):
+                consumed.append(i)
+                yield Chunk(content=f"## Part {i}", metadata=ChunkMetadata(source="a.md"))
+        
+        stream = pipeline.iter_enrich_chunks(source())
+        assert consumed == []
+        
+        first = next(stream)
+        assert first.metadata.section == "Part 0"
+        assert consumed == [0]
+        assert [c.metadata.section for c in stream] == ["Part 1", "Part 2"]
+    
+    def test_executor_enrich_chunks(self):
+        """Test that a supplied executor enriches chunks in input order."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        document = Document(
+            content="# Guide",
+            metadata=DocumentMetadata(source="guide.md", title="Guide"),
+        )
+        chunks = [
+            Chunk(
+                content=f"## Part {i}",
+                metadata=ChunkMetadata(source="guide.md", chunk_index=i),
+            )
+            for i in range(10)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pipeline = MetadataEnrichmentPipeline(
+                extractors=[SectionExtractor()], executor=executor
+            )
+            enriched = pipeline.enrich_chunks(chunks, document)
+        
+        assert [c.metadata.section for c in enriched] == [f"Part {i}" for i in range(10)]
+    
+    def test_shared_heading_scan_matches_standalone(self):
+        """Test that extractors fed one shared heading scan match standalone runs."""
+        content = "Intro\n\n## Setup\n\n<h1>Guide</h1>\n\nText\n\n### Details"
+        extractors = [SectionExtractor(), TitleExtractor(), HeadingExtractor(min_level=2)]
+        pipeline = MetadataEnrichmentPipeline(extractors=extractors)
+        
+        result = pipeline._run_extractors(content, {})
+        
+        for extractor in extractors:
+            for key, value in extractor.extract(content, {}).items():
+                assert result[key] == value
+        assert result["title_info"]["title"] == "Guide"
+        assert result["section_info"]["section_title"] == "Setup"
+        assert [h["text"] for h in result["headings"]] == ["Setup", "Details"]
+    
+    def test_bare_hash_line_does_not_hide_next_heading(self):
+        """Test that a lone '#' line matches neither as a heading nor across lines."""
+        content = "#\n\n<h2>Intro</h2>\n\nbody\n## Real\n"
+        extractor = HeadingExtractor(min_level=2)
+        pipeline = MetadataEnrichmentPipeline(extractors=[extractor])
+        
+        direct = extractor.extract(content, {})["headings"]
+        piped = pipeline._run_extractors(content, {})["headings"]
+        
+        assert [h["text"] for h in direct] == ["Intro", "Real"]
+        assert piped == direct
+    
+    def test_narrowed_heading_range_matches_direct_call(self):
+        """Test that a HeadingExtractor with a narrowed range scans with its own pattern."""
+        content = "===\n===\n---"
+        extractor = HeadingExtractor(min_level=2)
+        pipeline = MetadataEnrichmentPipeline(extractors=[TitleExtractor(), extractor])
+        
+        direct = extractor.extract(content, {})
+        piped = pipeline._run_extractors(content, {})
+        
+        assert direct["heading_count"] == 1
+        assert piped["headings"] == direct["headings"]
+    
+    def test_failing_extractor_is_skipped_and_logged(self, caplog):
+        """Test that expected extractor errors are logged and skipped."""
+        import logging
+        
+        class BrokenExtractor(MetadataExtractor):
+            def extract(self, content, existing_metadata=None):
+                raise ValueError("bad input")
+        
+        pipeline = MetadataEnrichmentPipeline(extractors=[BrokenExtractor(), SectionExtractor()])
+        chunk = Chunk(content="## Setup", metadata=ChunkMetadata(source="a.md"))
+        
+        with caplog.at_level(logging.DEBUG, logger="src.ingest.metadata"):
+            enriched = pipeline.enrich_chunk(chunk)
+        
+        assert enriched.metadata.section == "Setup"
+        assert "BrokenExtractor failed: bad input" in caplog.text
+    
+    def test_unexpected_extractor_error_propagates(self):
+        """Test that errors outside the expected set are not swallowed."""
+        class BuggyExtractor(MetadataExtractor):
+            def extract(self, content, existing_metadata=None):
+                raise RuntimeError("bug")
+        
+        pipeline = MetadataEnrichmentPipeline(extractors=[BuggyExtractor()])
+        chunk = Chunk(content="text", metadata=ChunkMetadata(source="a.md"))
+        
+        with pytest.raises(RuntimeError):
+            pipeline.enrich_chunk(chunk)
+    
+    def test_enrich_chunk_inplace_reuses_extra(self):
+        """Test that inplace enrichment updates the original extra dict."""
+        pipeline = MetadataEnrichmentPipeline(extractors=[SectionExtractor()])
+        chunk = Chunk(
+            content="## Setup",
+            metadata=ChunkMetadata(source="a.md", extra={"kept": True}),
+        )
+        
+        copied = pipeline.enrich_chunk(chunk)
+        assert copied.metadata.extra is not chunk.metadata.extra
+        assert "section_info" not in chunk.metadata.extra
+        
+        enriched = pipeline.enrich_chunk(chunk, inplace=True)
+        assert enriched.metadata.extra is chunk.metadata.extra
+        assert enriched.metadata.extra["kept"] is True
+        assert enriched.metadata.extra["section_info"]["section_title"] == "Setup"
+    
+    def test_content_independent_extractors_run_once_per_batch_key(self):
+        """Test that page metadata is extracted once per distinct page in a batch."""
+        calls = []
+        
+        class CountingPageExtractor(PageExtractor):
+            def extract(self, content, existing_metadata=None):
+                calls.append(existing_metadata["page_number"])
+                return super().extract(content, existing_metadata)
+        
+        pipeline = MetadataEnrichmentPipeline(extractors=[CountingPageExtractor()])
+        chunks = [
+            Chunk(
+                content=f"Text {i}",
+                metadata=ChunkMetadata(source="a.pdf", chunk_index=i, page_number=i // 3 + 1),
+            )
+            for i in range(6)
+        ]
+        
+        enriched = pipeline.enrich_chunks(chunks)
+        
+        assert calls == [1, 2]
+        pages = [c.metadata.extra["page_info"]["page_number"] for c in enriched]
+        assert pages == [1, 1, 1, 2, 2, 2]
+    
+    def test_repeated_content_uses_cached_results(self):
+        """Test that identical content is only extracted once per metadata key."""
+        calls = []
+        
+        class CountingExtractor(HeadingExtractor):
+            def extract(self, content, existing_metadata=None, precomputed_headings=None):
+                calls.append(content)
+                return super().extract(content, existing_metadata, precomputed_headings)
+        
+        pipeline = MetadataEnrichmentPipeline(
+            extractors=[CountingExtractor(), TitleExtractor()], cache_results=True
+        )
+        chunks = [
+            Chunk(content="# Footer", metadata=ChunkMetadata(source="a.md", chunk_index=i))
+            for i in range(5)
+        ]
+        
+        enriched = pipeline.enrich_chunks(chunks)
+        
+        assert len(calls) == 1
+        assert all(c.metadata.extra["headings"][0]["text"] == "Footer" for c in enriched)
+        
+        pipeline.clear_cache()
+        pipeline.enrich_chunk(chunks[0])
+        assert len(calls) == 2
+        
+        MetadataEnrichmentPipeline(extractors=[CountingExtractor()]).enrich_chunks(chunks)
+        assert len(calls) == 7
+    
+    def test_cached_results_are_not_shared(self):
+        """Test that editing one enriched chunk leaves cached results intact."""
+        pipeline = MetadataEnrichmentPipeline(
+            extractors=[HeadingExtractor(), SectionExtractor()], cache_results=True
+        )
+        chunks = [
+            Chunk(content="## Setup", metadata=ChunkMetadata(source="a.md")) for _ in range(3)
+        ]
+        
+        first, second = pipeline.enrich_chunks(chunks[:2])
+        first.metadata.extra["headings"][0]["text"] = "CHANGED"
+        first.metadata.extra["section_info"]["section_title"] = "CHANGED"
+        third = pipeline.enrich_chunk(chunks[2])
+        
+        for chunk in (second, third):
+            assert chunk.metadata.extra["headings"][0]["text"] == "Setup"
+            assert chunk.metadata.extra["section_info"]["section_title"] == "Setup"
+    
+    def test_shared_results_are_not_shared_objects(self):
+        """Test that batch-shared source results are copied into each item."""
+        pipeline = MetadataEnrichmentPipeline(extractors=[PageExtractor()])
+        chunks = [
+            Chunk(content=f"Text {i}", metadata=ChunkMetadata(source="a.md", page_number=1))
+            for i in range(3)
+        ]
+        
+        enriched = pipeline.enrich_chunks(chunks)
+        enriched[0].metadata.extra["page_info"]["page_number"] = 99
+        
+        assert [c.metadata.extra["page_info"]["page_number"] for c in enriched[1:]] == [1, 1]
+    
+    def test_cache_follows_extractor_settings(self):
+        """Test that changing an extractor's settings bypasses older cached results."""
+        extractor = HeadingExtractor()
+        pipeline = MetadataEnrichmentPipeline(extractors=[extractor], cache_results=True)
+        chunk = Chunk(content="# Title", metadata=ChunkMetadata(source="a.md"))
+        
+        assert pipeline.enrich_chunk(chunk).metadata.extra["heading_count"] == 1
+        extractor.min_level = 2
+        assert pipeline.enrich_chunk(chunk).metadata.extra["heading_count"] == 0
+    
     def test_add_extractor(self):
         """Test adding an extractor to pipeline."""
         pipeline = MetadataEnrichmentPipeline(extractors=[])
@@ -408,6 +882,25 @@ class TestMetadataEnrichmentPipeline:
         assert removed is True
         assert len(pipeline.extractors) == initial_count - 1
     
+    def test_extractors_are_compiled_when_set(self):
+        """Test that heading patterns are compiled before enrichment starts."""
+        from src.ingest.metadata import _compile_heading_pattern
+        
+        _compile_heading_pattern.cache_clear()
+        MetadataEnrichmentPipeline(extractors=[HeadingExtractor(min_level=2, max_level=4)])
+        
+        assert _compile_heading_pattern.cache_info().currsize == 1
+    
+    def test_extractors_property_returns_copy(self):
+        """Test that extractors can only be changed through the pipeline."""
+        pipeline = MetadataEnrichmentPipeline(extractors=[TitleExtractor()])
+        
+        pipeline.extractors.append(HeadingExtractor())
+        assert len(pipeline.extractors) == 1
+        
+        pipeline.extractors = [SectionExtractor(), HeadingExtractor()]
+        assert [type(e) for e in pipeline.extractors] == [SectionExtractor, HeadingExtractor]
+    
     def test_merge_strategy_first(self):
         """Test 'first' merge strategy."""
         pipeline = MetadataEnrichmentPipeline(
@@ -437,6 +930,28 @@ class TestMetadataEnrichmentPipeline:
         
         # Last value should be kept
         assert result["title_info"]["title"] == "Second"
+    
+    def test_merge_strategy_can_be_changed(self):
+        """Test that reassigning merge_strategy changes how results merge."""
+        pipeline = MetadataEnrichmentPipeline(extractors=[], merge_strategy="first")
+        pipeline.merge_strategy = "last"
+        
+        result = pipeline._merge_metadata({"title": "First"}, {"title": "Second"})
+        
+        assert result["title"] == "Second"
+        assert pipeline.merge_strategy == "last"
+    
+    def test_merge_strategy_merge_leaves_inputs_untouched(self):
+        """Test 'merge' strategy deep-merges without mutating its inputs."""
+        pipeline = MetadataEnrichmentPipeline(extractors=[], merge_strategy="merge")
+        
+        base = {"info": {"a": 1, "b": 2}, "keep": "x"}
+        new = {"info": {"b": 3, "c": None}, "keep": None}
+        
+        result = pipeline._merge_metadata(base, new)
+        
+        assert result == {"info": {"a": 1, "b": 3}, "keep": "x"}
+        assert base == {"info": {"a": 1, "b": 2}, "keep": "x"}
 
 
 class TestPipelineFactories:
@@ -5,6 +5,7 @@ for the parent document retrieval pattern.
 """
 
 import json
+import pickle
 import pytest
 from src.ingest.models import Document, DocumentMetadata, Chunk, ChunkMetadata
 from src.ingest.chunkers import RecursiveChunker, FixedSizeChunker
@@ -12,6 +13,8 @@ from src.ingest.retriever import (
     ParentChunk,
     ChunkMapping,
     ParentDocumentRetriever,
+    RETRIEVAL_TYPE,
+    _batch_ids,
 )
 
 
@@ -50,6 +53,55 @@ def long_document() -> Document:
     return Document(content=content, metadata=metadata)
 
 
+class TestBatchIds:
+    """Tests for the batched ID helper."""
+    
+    def test_batch_ids_are_unique_hex(self) -> None:
+        """Test that a batch yields distinct 32-character hex IDs."""
+        ids = _batch_ids(100)
+        assert len(ids) == 100
+        assert len(set(ids)) == 100
+        for cid in ids:
+            assert len(cid) == 32
+            int(cid, 16)
+    
+    def test_batch_ids_empty(self) -> None:
+        """Test that a zero-sized batch draws nothing."""
+        assert _batch_ids(0) == []
+    
+    def test_add_mapping_assigns_missing_id(self) -> None:
+        """Test that add_mapping fills in an ID for an anonymous child."""
+        mapping = ChunkMapping()
+        child = Chunk(content="Child", metadata=ChunkMetadata(source="test.txt", chunk_index=0))
+        parent = ParentChunk(
+            id="parent_1",
+            content="Parent",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+        )
+        
+        mapping.add_mapping(child, parent)
+        
+        assert child.id is not None
+        assert mapping.get_parent(child.id) is parent
+    
+    def test_empty_ids_are_replaced(self) -> None:
+        """Test that an empty child ID is treated as missing, like a parent's."""
+        mapping = ChunkMapping()
+        parent = ParentChunk(
+            id="parent_1",
+            content="Parent",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+        )
+        child = Chunk(content="Child", metadata=ChunkMetadata(source="test.txt"), id="")
+        children = [Chunk(content="Other", metadata=ChunkMetadata(source="test.txt"), id="")]
+        
+        mapping.add_mapping(child, parent)
+        mapping.add_mappings(children, parent)
+        
+        assert child.id and children[0].id
+        assert parent.child_ids == [child.id, children[0].id]
+
+
 class TestParentChunk:
     """Tests for ParentChunk dataclass."""
     
@@ -103,6 +155,18 @@ class TestParentChunk:
         assert restored.id == parent.id
         assert restored.content == parent.content
         assert restored.child_ids == parent.child_ids
+    
+    def test_uses_slots(self) -> None:
+        """Test that parent chunks and mappings carry no per-instance dict."""
+        metadata = ChunkMetadata(source="test.txt", chunk_index=0)
+        parent = ParentChunk(id="parent_1", content="Parent", metadata=metadata)
+        mapping = ChunkMapping()
+        mapping.add_mapping(Chunk(content="Child", metadata=metadata, id="child_1"), parent)
+        assert not hasattr(parent, "__dict__")
+        assert not hasattr(mapping, "__dict__")
+        
+        restored = pickle.loads(pickle.dumps(mapping))
+        assert restored.get_parent("child_1").id == "parent_1"
 
 
 class TestChunkMapping:
@@ -145,6 +209,75 @@ class TestChunkMapping:
         children = mapping.get_children("parent_1")
         assert len(children) == 3
     
+    def test_get_children_skips_dangling_ids(self) -> None:
+        """Test that child IDs without a stored chunk are skipped."""
+        mapping = ChunkMapping()
+        parent = ParentChunk(
+            id="parent_1",
+            content="Parent",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+        )
+        child = Chunk(
+            content="Child",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+            id="child_1",
+        )
+        mapping.add_mapping(child, parent)
+        mapping.parent_to_children["parent_1"].append("missing")
+        
+        assert mapping.get_children("parent_1") == [child]
+        assert mapping.get_children("unknown") == []
+    
+    def test_add_mappings_matches_add_mapping(self) -> None:
+        """Test that the bulk path records the same state as per-child calls."""
+        def build():
+            parent = ParentChunk(
+                id="parent_1",
+                content="Parent",
+                metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+            )
+            children = [
+                Chunk(
+                    content=f"Child {i}",
+                    metadata=ChunkMetadata(source="test.txt", chunk_index=i),
+                    id=f"child_{i}",
+                )
+                for i in range(4)
+            ]
+            return parent, children + [children[1]]
+        
+        single = ChunkMapping()
+        parent, children = build()
+        for child in children:
+            single.add_mapping(child, parent)
+        
+        bulk = ChunkMapping()
+        bulk_parent, bulk_children = build()
+        bulk.add_mappings(bulk_children, bulk_parent)
+        
+        assert bulk.child_to_parent == single.child_to_parent
+        assert bulk.parent_to_children == single.parent_to_children
+        assert bulk_parent.child_ids == parent.child_ids
+        assert len(bulk) == len(single)
+    
+    def test_add_mappings_assigns_missing_ids(self) -> None:
+        """Test that anonymous children get distinct IDs in the bulk path."""
+        mapping = ChunkMapping()
+        parent = ParentChunk(
+            id="parent_1",
+            content="Parent",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+        )
+        children = [
+            Chunk(content=f"Child {i}", metadata=ChunkMetadata(source="test.txt", chunk_index=i))
+            for i in range(3)
+        ]
+        
+        mapping.add_mappings(children, parent)
+        
+        assert len({c.id for c in children}) == 3
+        assert parent.child_ids == [c.id for c in children]
+    
     def test_get_parents_for_children(self) -> None:
         """Test getting unique parents for multiple children."""
         mapping = ChunkMapping()
@@ -163,6 +296,52 @@ class TestChunkMapping:
         parents = mapping.get_parents_for_children(["child_0_0", "child_0_1", "child_1_0"])
         assert len(parents) == 2  # Should be deduplicated
     
+    def test_get_parents_for_children_keeps_first_seen_order(self) -> None:
+        """Test that parents come back in first-match order, skipping unknown IDs."""
+        mapping = ChunkMapping()
+        for p in range(3):
+            parent = ParentChunk(
+                id=f"parent_{p}",
+                content=f"Parent {p}",
+                metadata=ChunkMetadata(source="test.txt", chunk_index=p),
+            )
+            child = Chunk(
+                content=f"Child {p}",
+                metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+                id=f"child_{p}",
+            )
+            mapping.add_mapping(child, parent)
+        
+        parents = mapping.get_parents_for_children(["child_2", "missing", "child_0", "child_2"])
+        assert [p.id for p in parents] == ["parent_2", "parent_0"]
+    
+    def test_add_mapping_is_idempotent(self) -> None:
+        """Test that re-adding a child does not duplicate its ID."""
+        mapping = ChunkMapping()
+        parent = ParentChunk(
+            id="parent_1",
+            content="Parent",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+        )
+        child = Chunk(
+            content="Child",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+            id="child_1",
+        )
+        
+        mapping.add_mapping(child, parent)
+        mapping.add_mapping(child, parent)
+        
+        assert mapping.parent_to_children["parent_1"] == ["child_1"]
+        assert parent.child_ids == ["child_1"]
+        
+        # A restored mapping rebuilds its membership sets on demand
+        restored = ChunkMapping.from_dict(mapping.to_dict())
+        restored_parent = restored.parents["parent_1"]
+        restored.add_mapping(restored.children["child_1"], restored_parent)
+        assert restored.parent_to_children["parent_1"] == ["child_1"]
+        assert restored_parent.child_ids == ["child_1"]
+    
     def test_mapping_serialization(self) -> None:
         """Test mapping serialization and deserialization."""
         mapping = ChunkMapping()
@@ -182,6 +361,54 @@ class TestChunkMapping:
         assert len(restored) == 1
         assert restored.get_parent("child_1") is not None
     
+    def test_mapping_json_round_trip(self) -> None:
+        """Test that to_json/from_json matches the to_dict layout."""
+        mapping = ChunkMapping()
+        parent = ParentChunk(
+            id="parent_1",
+            content="Parent",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+        )
+        child_metadata = ChunkMetadata(source="test.txt", chunk_index=0, extra={"k": 1})
+        mapping.add_mapping(Chunk(content="Child", metadata=child_metadata, id="child_1"), parent)
+        
+        data = mapping.to_json()
+        
+        assert isinstance(data, bytes)
+        assert json.loads(data) == mapping.to_dict()
+        restored = ChunkMapping.from_json(data)
+        assert restored.get_parent("child_1").child_ids == ["child_1"]
+        assert restored.children["child_1"].metadata.extra == {"k": 1}
+    
+    def test_restored_parent_ids_are_shared(self) -> None:
+        """Test that from_dict stores one string per restored ID."""
+        mapping = ChunkMapping()
+        parent = ParentChunk(
+            id="parent_1",
+            content="Parent",
+            metadata=ChunkMetadata(source="test.txt", chunk_index=0),
+        )
+        for i in range(3):
+            child = Chunk(
+                content=f"Child {i}",
+                metadata=ChunkMetadata(source="test.txt", chunk_index=i),
+                id=f"child_{i}",
+            )
+            mapping.add_mapping(child, parent)
+        
+        restored = ChunkMapping.from_dict(json.loads(json.dumps(mapping.to_dict())))
+        
+        pids = list(restored.child_to_parent.values())
+        assert pids == ["parent_1"] * 3
+        assert all(pid is pids[0] for pid in pids)
+        
+        # Child IDs are shared across every table that mentions them
+        for cid in restored.child_to_parent:
+            assert restored.children[cid].id is cid
+        restored_parent = restored.parents["parent_1"]
+        assert restored_parent.id is pids[0]
+        assert all(a is b for a, b in zip(restored_parent.child_ids, restored.child_to_parent))
+    
     def test_clear_mapping(self) -> None:
         """Test clearing the mapping."""
         mapping = ChunkMapping()
@@ -262,6 +489,8 @@ class TestParentDocumentRetriever:
         for child in child_chunks:
             assert child.metadata.parent_id is not None
             assert "parent_index" in child.metadata.extra
+            assert child.metadata.extra["retrieval_type"] == RETRIEVAL_TYPE
+            assert child.metadata.extra["strategy"] == "recursive"
     
     def test_get_parent_for_child(self, sample_document: Document) -> None:
         """Test retrieving parent for a child chunk."""
@@ -316,6 +545,32 @@ class TestParentDocumentRetriever:
         assert len(all_chunks) > 0
         assert len(retriever.get_parent_chunks()) > 0
     
+    def test_add_documents_in_worker_processes(
+        self,
+        sample_document: Document,
+        long_document: Document,
+    ) -> None:
+        """Test that pooled splitting records the same mappings as the serial path."""
+        documents = [sample_document, long_document] * 2
+        
+        def build(n_workers: int) -> ParentDocumentRetriever:
+            return ParentDocumentRetriever(
+                parent_splitter=RecursiveChunker(chunk_size=200, chunk_overlap=20),
+                child_splitter=RecursiveChunker(chunk_size=50, chunk_overlap=10),
+                n_workers=n_workers,
+            )
+        
+        serial = build(1)
+        serial_chunks = serial.add_documents(documents)
+        pooled = build(2)
+        pooled_chunks = pooled.add_documents(documents)
+        
+        assert [c.content for c in pooled_chunks] == [c.content for c in serial_chunks]
+        assert len(pooled) == len(serial)
+        assert len(pooled.get_parent_chunks()) == len(serial.get_parent_chunks())
+        for child in pooled_chunks:
+            assert pooled.get_parent(child.id).id == child.metadata.parent_id
+    
     def test_get_children_for_parent(self, sample_document: Document) -> None:
         """Test getting all children for a parent."""
         parent_splitter = RecursiveChunker(chunk_size=150, chunk_overlap=20)
@@ -20,6 +20,9 @@ from src.ingest.tables import (
     StructuredTableData,
     TableDataHandler,
     TableCollection,
+    _module_available,
+    _page_blocks,
+    _parse_pages,
 )
 
 
@@ -45,6 +48,29 @@ class TestExtractedTable:
         """Test table with only whitespace is considered empty."""
         table = ExtractedTable(data=[["  ", ""], [" ", "  "]])
         assert table.is_empty
+        assert ExtractedTable(data=[[], ["\t\n", "\u00a0"]]).is_empty
+        assert not ExtractedTable(data=[["", ""], ["", " x "]]).is_empty
+
+    def test_non_string_cells_coerced_once(self):
+        """Test non-string cells become strings at construction; string data is kept as-is."""
+        table = ExtractedTable(data=[["Qty", "Price"], [3, 1.5], [None, "x"]])
+        assert table.data == [["Qty", "Price"], ["3", "1.5"], ["None", "x"]]
+        data = [["a", "b"]]
+        assert ExtractedTable(data=data).data is data
+
+    def test_converters_format_cells_added_after_construction(self):
+        """Test converters still str() non-string cells appended to data later."""
+        table = ExtractedTable(data=[["Qty", "Note"]])
+        table.data.append([3, None])
+        for converter in (
+            MarkdownTableConverter(), CSVTableConverter(), CSVTableConverter(delimiter="||"),
+            PlainTextTableConverter(), PlainTextTableConverter(pad_columns=False),
+            HTMLTableConverter(), JSONTableConverter(),
+        ):
+            result = converter.convert(table)
+            assert "3" in result and "None" in result
+        rows = TableDataHandler(infer_types=False).process(table).rows
+        assert rows == [{"qty": "3", "note": "None"}]
 
     def test_get_cell(self):
         """Test getting individual cells."""
@@ -100,6 +126,20 @@ class TestTableToTextConverters:
         assert "| Alice" in result
         assert "---" in result
 
+    def test_markdown_converter_ragged_rows(self):
+        """Test Markdown pads short rows and sizes columns to the widest cell."""
+        table = ExtractedTable(data=[["Name", "Age"], ["Alexander"], ["Bo", "7", "{x}"]])
+        result = MarkdownTableConverter().convert(table)
+        assert result.split("\n") == [
+            "| Name      | Age |     |",
+            "| --------- | --- | --- |",
+            "| Alexander |     |     |",
+            "| Bo        | 7   | {x} |",
+        ]
+        no_header = MarkdownTableConverter(include_header_row=False).convert(table)
+        assert "---" not in no_header
+        assert len(no_header.split("\n")) == 3
+
     def test_csv_converter(self, sample_table):
         """Test CSV conversion."""
         converter = CSVTableConverter()
@@ -115,6 +155,15 @@ class TestTableToTextConverters:
         result = converter.convert(table)
         assert '"Hello, World"' in result
 
+    def test_csv_quoting_edge_cases(self):
+        """Test CSV quoting of quotes, newlines, blank rows and long delimiters."""
+        table = ExtractedTable(data=[['Say "hi"', "a\nb"], [""], ["x", "y"]])
+        assert CSVTableConverter().convert(table) == '"Say ""hi""","a\nb"\n\nx,y'
+        converter = CSVTableConverter(delimiter=";", quote_char="'")
+        assert converter.convert(table) == 'Say "hi";\'a\nb\'\n\nx;y'
+        wide = CSVTableConverter(delimiter=" | ")
+        assert wide.convert(ExtractedTable(data=[["a | b", "c"]])) == '"a | b" | c'
+
     def test_plain_text_converter(self, sample_table):
         """Test plain text conversion."""
         converter = PlainTextTableConverter()
@@ -122,6 +171,17 @@ class TestTableToTextConverters:
         assert "Name" in result
         assert "Alice" in result
 
+    def test_plain_text_converter_ragged_rows(self):
+        """Test plain text pads short rows and keeps brace separators literal."""
+        table = ExtractedTable(data=[["Name", "Age"], ["Alexander"], ["Bo", "7"]])
+        assert PlainTextTableConverter().convert(table).split("\n") == [
+            "Name       Age",
+            "Alexander     ",
+            "Bo         7  ",
+        ]
+        braces = PlainTextTableConverter(column_separator="{}").convert(table)
+        assert braces.split("\n")[0] == "Name     {}Age"
+
     def test_html_converter(self, sample_table):
         """Test HTML conversion."""
         converter = HTMLTableConverter()
@@ -157,6 +217,22 @@ class TestTableToTextConverters:
         assert len(parsed) == 3  # All rows as arrays
         assert parsed[0] == ["Name", "Age", "City"]
 
+    def test_json_converter_matches_stdlib_layout(self, sample_table):
+        """Test JSON output is laid out exactly as json.dumps for any indent."""
+        import json
+        table = ExtractedTable(data=[["Name", "Note"], ["Zoë", 'say "hi"\n']])
+        expected_rows = [{"Name": "Zoë", "Note": 'say "hi"\n'}]
+        for indent in (2, 4, None):
+            result = JSONTableConverter(indent=indent).convert(table)
+            assert result == json.dumps(expected_rows, indent=indent, ensure_ascii=False)
+
+    def test_json_converter_lone_surrogate_falls_back(self):
+        """Test text orjson rejects is still serialized, as json.dumps would."""
+        import json
+        table = ExtractedTable(data=[["h", "h2"], ["\ud800", "x"]])
+        result = JSONTableConverter().convert(table)
+        assert result == json.dumps([{"h": "\ud800", "h2": "x"}], indent=2, ensure_ascii=False)
+
     def test_get_converter(self):
         """Test get_converter factory function."""
         for fmt in TableToTextFormat:
@@ -291,6 +367,24 @@ class TestTableDataHandler:
         assert result.column_types["active"] == "boolean"
         assert result.rows[0]["active"] is True
 
+    def test_type_inference_reuses_parsed_numbers(self):
+        """Test that inference leaves parsed numbers for the conversion step."""
+        handler = TableDataHandler()
+        parsed = {}
+        assert handler._infer_column_type(["1,000", "7", "7", ""], parsed) == "integer"
+        assert parsed == {"1,000": 1000, "7": 7}
+        parsed = {}
+        assert handler._infer_column_type(["1", "2.5"], parsed) == "float"
+        assert parsed == {"1": 1.0, "2.5": 2.5}
+        parsed = {}
+        assert handler._infer_column_type(["yes", "no"], parsed) == "boolean"
+        assert parsed == {}
+
+        table = ExtractedTable(data=[["Qty", "Price"], ["1,000", "2"], ["7", "2.5"], ["", "3"]])
+        result = handler.process(table)
+        assert [row["qty"] for row in result.rows] == [1000, 7, None]
+        assert [row["price"] for row in result.rows] == [2.0, 2.5, 3.0]
+
     def test_no_type_inference(self):
         """Test disabling type inference."""
         table = ExtractedTable(data=[["Count"], ["100"]])
@@ -379,6 +473,18 @@ class TestTableCollection:
         assert len(structured) == 1
         assert structured[0].num_rows == 1
 
+    def test_to_structured_parallel_matches_serial(self):
+        """Test parallel to_structured matches serial output and keeps source tables."""
+        tables = [
+            ExtractedTable(data=[["Name", "Age"], [f"P{i}", str(i)]], table_index=i)
+            for i in range(TableCollection.PARALLEL_THRESHOLD + 1)
+        ]
+        collection = TableCollection(tables=tables)
+        serial = collection.to_structured()
+        parallel = collection.to_structured(n_workers=2)
+        assert [s.to_dict() for s in parallel] == [s.to_dict() for s in serial]
+        assert all(s.source_table is t for s, t in zip(parallel, tables))
+
     def test_to_text(self):
         """Test converting to text."""
         tables = [
@@ -409,6 +515,38 @@ class TestTableExtractors:
         # Just check it doesn't crash
         _ = extractor.is_available()
 
+    def test_parse_pages(self):
+        """Test expanding camelot page specs into page numbers."""
+        assert _parse_pages("all", 3) == [1, 2, 3]
+        assert _parse_pages("1,3", 5) == [1, 3]
+        assert _parse_pages("2-4", 5) == [2, 3, 4]
+        assert _parse_pages("1, 4-end", 6) == [1, 4, 5, 6]
+        assert _parse_pages("end", 6) == [6]
+        # Sorted and deduplicated, as camelot reads them
+        assert _parse_pages("3,1") == [1, 3]
+        assert _parse_pages("1-3,2") == [1, 2, 3]
+        with pytest.raises(ValueError):
+            _parse_pages("2-end")
+
+    def test_page_blocks(self):
+        """Test splitting pages into contiguous per-worker blocks."""
+        assert _page_blocks(list(range(1, 11)), 3) == ["1-4", "5-7", "8-10"]
+        assert _page_blocks([1, 2, 5, 6, 9], 2) == ["1-2,5", "6,9"]
+        assert _page_blocks([4], 8) == ["4"]
+
+    def test_camelot_n_workers_default(self):
+        """Test Camelot extraction is serial unless workers are requested."""
+        assert CamelotTableExtractor().n_workers == 1
+        assert CamelotTableExtractor(n_workers=4).n_workers == 4
+
+    def test_module_availability_is_cached(self):
+        """Test that library probes are answered once per process."""
+        assert _module_available("json") is True
+        assert _module_available("no_such_table_library") is False
+        hits = _module_available.cache_info().hits
+        _module_available("no_such_table_library")
+        assert _module_available.cache_info().hits == hits + 1
+
     def test_tabula_availability(self):
         """Test Tabula availability check."""
         extractor = TabulaTableExtractor()